@@ -1,14 +1,18 @@
 """Telegram bot handlers for EtherScope."""
 
+import asyncio
+import time
 from datetime import datetime
+from typing import Awaitable, Callable
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ChatAction
 from telegram.error import BadRequest
 from telegram.ext import ContextTypes, CallbackQueryHandler, MessageHandler, filters
 
-# simple in-memory user state tracker
-user_states: dict[int, str] = {}
+# per-chat job queues: jobs for one chat run in order, different chats run concurrently
+_chat_queues: dict[int, asyncio.Queue] = {}
+_chat_workers: dict[int, asyncio.Task] = {}
 
 from core.config import Config
 from core.exceptions import (
@@ -19,14 +23,191 @@ from core.exceptions import (
 from core.logger import get_logger
 from models.wallet import ActivityLevel, WalletAnalysis
 from services.analysis_service import AnalysisService
-from services.blockchain_service import BlockchainService
-from services.cache_service import get_cache_service
+from services.blockchain_service import BlockchainService, get_blockchain_service
+from services.cache_service import CacheService, get_cache_service
 
 logger = get_logger(__name__)
 
-# Initialize services
-blockchain_service = BlockchainService()
-cache_service = get_cache_service()
+# in-memory user state tracker; entries expire so abandoned prompts don't linger
+user_states = CacheService(
+    enabled=True,
+    ttl=Config.USER_STATE_TTL_SECONDS,
+    max_size=Config.USER_STATE_MAX_SIZE,
+)
+
+# Static message fragments, built once at import
+_TS_FMT = "%Y-%m-%d %H:%M:%S UTC"
+_MAX_LEN = Config.TELEGRAM_MAX_MESSAGE_LENGTH
+_SEP = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+_REPORT_HEADER = "💼 <b>Wallet Analysis Report</b>"
+_TOKEN_HEADER = "<b>🪙 Token Holdings</b>"
+_TX_HEADER = "<b>📊 Transaction History</b>"
+_LATEST_TX_HEADER = "<b>📝 Latest Transactions</b>"
+_BEHAVIOR_HEADER = "<b>🎯 Behavioral Analysis</b>"
+_HISTORY_HEADER = "<b>📅 Account History</b>"
+_ARROW_IN = "↓"
+_ARROW_OUT = "↑"
+
+_WELCOME_MESSAGE = (
+    "👋 <b>Welcome to EtherScope</b>\n\n"
+    "Your Web3 Wallet Intelligence Bot\n\n"
+    "<b>📖 Available Commands:</b>\n\n"
+    "/analyze [wallet_address]\n"
+    "  Analyze an Ethereum wallet address\n\n"
+    "/health\n"
+    "  Check bot health status\n\n"
+    "<b>💡 Example:</b>\n"
+    "/analyze 0x1234567890123456789012345678901234567890\n\n"
+    "Bot will provide detailed analysis including:\n"
+    "  • ETH balance and token holdings\n"
+    "  • Transaction statistics\n"
+    "  • DeFi and NFT activity detection\n"
+    "  • Behavioral classification\n"
+    "  • Overall wallet score\n"
+)
+
+# /health report: configuration is fixed at startup, so only the cache
+# figures and the timestamp are filled in per request
+_HEALTH_HEADER = (
+    "✅ <b>EtherScope Bot Status</b>\n\n"
+    "<b>System Information</b>\n"
+    f"Environment: <code>{Config.ENVIRONMENT}</code>\n"
+    f"Blockchain Provider: <code>{Config.BLOCKCHAIN_API_PROVIDER}</code>\n"
+    f"API Timeout: <code>{Config.API_TIMEOUT}s</code>\n\n"
+)
+_HEALTH_CACHE_FMT = (
+    "<b>Cache Status</b>\n"
+    "Enabled: <code>%s</code>\n"
+    "Size: <code>%d/%d</code>\n"
+    "Utilization: <code>%.1f%%</code>\n\n"
+)
+_HEALTH_FOOTER_FMT = (
+    "<b>Bot Status</b>\n"
+    "Status: <code>🟢 Operational</code>\n"
+    "Timestamp: <code>%s</code>\n"
+)
+
+# inline buttons for analyze and health, shown under the welcome message
+_START_MARKUP = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("🔍 Analyze Wallet", callback_data="analyze")],
+        [InlineKeyboardButton("📈 Health Check", callback_data="health")],
+    ]
+)
+
+
+def schedule(chat_id: int | None, job: Callable[[], Awaitable[None]]) -> None:
+    """Queue a job for a chat so the calling handler can return immediately.
+
+    Jobs for the same chat are executed in submission order by a worker task
+    that is started lazily and exits once the chat's queue is drained.
+
+    Args:
+        chat_id: Chat the job belongs to
+        job: Zero-argument coroutine function to run
+    """
+    queue = _chat_queues.get(chat_id)
+    if queue is None:
+        queue = _chat_queues[chat_id] = asyncio.Queue()
+        _chat_workers[chat_id] = asyncio.create_task(_chat_worker(chat_id, queue))
+    queue.put_nowait(job)
+
+
+async def _chat_worker(chat_id: int | None, queue: asyncio.Queue) -> None:
+    """Drain a chat's job queue, one job at a time."""
+    try:
+        while True:
+            job = await queue.get()
+            try:
+                await job()
+            except Exception as e:
+                logger.error("Queued job failed for chat %s: %s", chat_id, e, exc_info=True)
+            finally:
+                queue.task_done()
+
+            if queue.empty():
+                return
+    finally:
+        # also reached on cancellation, so a dead worker never leaves its
+        # queue registered and the next schedule() starts a fresh one
+        if _chat_queues.get(chat_id) is queue:
+            del _chat_queues[chat_id]
+            _chat_workers.pop(chat_id, None)
+
+
+async def _reply_sections(update: Update, sections: list[str]) -> None:
+    """Reply with a sectioned report, packed into Telegram-sized messages.
+
+    Messages are sent one after another: Telegram does not guarantee the
+    order of concurrently sent messages, and a report must read top to bottom.
+
+    Args:
+        update: Telegram update to reply to
+        sections: Report sections, see :func:`format_wallet_analysis`
+    """
+    for chunk in _pack_sections(sections):
+        await update.message.reply_html(chunk)
+
+
+async def _load_analysis(
+    blockchain_service: BlockchainService, wallet_address: str, signature: int | None
+) -> tuple[int | None, WalletAnalysis]:
+    """Fetch wallet data and build a fresh analysis.
+
+    Args:
+        blockchain_service: Service to fetch wallet data with
+        wallet_address: Validated address to analyze
+        signature: Wallet nonce if it was already fetched
+
+    Returns:
+        Cache entry, a (signature, analysis) pair
+    """
+    need_signature = Config.CACHE_SIGNATURE_STRATEGY == "tx_count" and signature is None
+    (
+        eth_balance,
+        token_summary,
+        transaction_summary,
+        tx_count,
+    ) = await blockchain_service.get_full_wallet(
+        wallet_address, limit=10, with_tx_count=need_signature
+    )
+    if need_signature:
+        signature = tx_count
+
+    behavior = AnalysisService.analyze_wallet_behavior(
+        transaction_summary=transaction_summary,
+        total_transactions=transaction_summary.total_transactions,
+    )
+    # one reference time for days_active and analyzed_at
+    now = datetime.utcnow()
+    days_active, first_tx_date = AnalysisService.calculate_days_active(
+        transaction_summary.last_transactions, sorted_desc=True, now=now
+    )
+
+    # only keep the transactions the report renders; the rest were
+    # needed for the analysis above but would just bloat the cache entry
+    transaction_summary = transaction_summary.model_copy(
+        update={
+            "last_transactions": transaction_summary.last_transactions[
+                : Config.REPORT_LATEST_TRANSACTIONS
+            ]
+        }
+    )
+
+    eth_balance_display = BlockchainService._format_ether(eth_balance)
+    analysis = WalletAnalysis.build_trusted(
+        wallet_address=wallet_address,
+        eth_balance=eth_balance,
+        eth_balance_display=eth_balance_display,
+        usd_value=None,
+        token_summary=token_summary,
+        transaction_summary=transaction_summary,
+        behavior=behavior,
+        analyzed_at=now,
+        first_transaction_date=first_tx_date,
+        days_active=days_active,
+    )
+    return signature, analysis
 
 
 async def perform_analysis(update: Update, context: ContextTypes.DEFAULT_TYPE, wallet_address: str) -> None:
@@ -38,210 +219,200 @@ async def perform_analysis(update: Update, context: ContextTypes.DEFAULT_TYPE, w
         wallet_address: Address to analyze
     """
     user_id = update.effective_user.id if update.effective_user else "unknown"
+    blockchain_service = get_blockchain_service()
+    cache_service = get_cache_service()
 
     try:
         # validate
         wallet_address = BlockchainService.validate_address(wallet_address)
 
-        # show typing indicator
-        await context.bot.send_chat_action(
-            chat_id=update.effective_chat.id,
-            action=ChatAction.TYPING,
-        )
-
-        # check cache
+        # check cache; entries are (signature, analysis) pairs, and with the
+        # tx_count strategy a hit is only served while the wallet's nonce is unchanged
+        signature = None
         cache_key = f"analysis:{wallet_address}"
-        cached_analysis = cache_service.get(cache_key)
-        if cached_analysis:
-            logger.info(f"Returning cached analysis for {wallet_address}")
-            msg = BotFormatter.format_wallet_analysis(cached_analysis)
-            for chunk in _split_message(msg):
-                await update.message.reply_html(chunk)
-            return
-
-        eth_balance = await blockchain_service.get_eth_balance(wallet_address)
-        token_summary = await blockchain_service.get_erc20_tokens(wallet_address)
-        transaction_summary = await blockchain_service.get_transactions(wallet_address, limit=10)
-
-        behavior = AnalysisService.analyze_wallet_behavior(
-            transaction_summary=transaction_summary,
-            total_transactions=transaction_summary.total_transactions,
-        )
-        days_active, first_tx_date = AnalysisService.calculate_days_active(
-            transaction_summary.last_transactions
+        cached = cache_service.get(cache_key)
+        if cached:
+            cached_signature, cached_analysis = cached
+            if Config.CACHE_SIGNATURE_STRATEGY == "tx_count":
+                try:
+                    signature = await blockchain_service.get_transaction_count(wallet_address)
+                except BlockchainServiceError as e:
+                    # staleness is unknown, but a cached report beats an error reply
+                    logger.warning(
+                        "Could not revalidate cached analysis for %s: %s", wallet_address, e
+                    )
+                    signature = cached_signature
+            if signature == cached_signature:
+                # a hit is answered right away, so no typing indicator
+                logger.info("Returning cached analysis for %s", wallet_address)
+                await _reply_sections(update, format_wallet_analysis(cached_analysis))
+                return
+            logger.info("Cached analysis for %s is stale, refreshing", wallet_address)
+            cache_service.delete(cache_key)
+
+        # the typing indicator and the lookups are independent, so send/fetch
+        # them concurrently; concurrent requests for the same wallet share one load
+        typing_result, entry = await asyncio.gather(
+            context.bot.send_chat_action(
+                chat_id=update.effective_chat.id,
+                action=ChatAction.TYPING,
+            ),
+            cache_service.get_or_set(
+                cache_key, lambda: _load_analysis(blockchain_service, wallet_address, signature)
+            ),
+            return_exceptions=True,
         )
+        if isinstance(typing_result, Exception):
+            logger.warning("Could not send typing indicator: %s", typing_result)
+        if isinstance(entry, BaseException):
+            raise entry
+        _, analysis = entry
 
-        eth_balance_display = BlockchainService._format_ether(eth_balance)
-        analysis = WalletAnalysis(
-            wallet_address=wallet_address,
-            eth_balance=eth_balance,
-            eth_balance_display=eth_balance_display,
-            usd_value=None,
-            token_summary=token_summary,
-            transaction_summary=transaction_summary,
-            behavior=behavior,
-            first_transaction_date=first_tx_date,
-            days_active=days_active,
-        )
-
-        cache_service.set(cache_key, analysis)
+        await _reply_sections(update, format_wallet_analysis(analysis))
 
-        msg = BotFormatter.format_wallet_analysis(analysis)
-        for chunk in _split_message(msg):
-            await update.message.reply_html(chunk)
-
-        logger.info(f"Analysis sent for wallet {wallet_address}")
+        logger.info("Analysis sent for wallet %s", wallet_address)
 
     except InvalidWalletAddressError as e:
-        logger.warning(f"Invalid wallet address from user {user_id}: {str(e)}")
-        await update.message.reply_html(BotFormatter.format_error_message(e))
+        logger.warning("Invalid wallet address from user %s: %s", user_id, e)
+        await update.message.reply_html(format_error_message(e))
     except BlockchainServiceError as e:
-        logger.error(f"Blockchain service error for user {user_id}: {str(e)}")
-        await update.message.reply_html(BotFormatter.format_error_message(e))
+        logger.error("Blockchain service error for user %s: %s", user_id, e)
+        await update.message.reply_html(format_error_message(e))
     except Exception as e:
-        logger.error(f"Unexpected error during analysis for user {user_id}: {str(e)}")
-        await update.message.reply_html(BotFormatter.format_error_message(e))
-
+        logger.error("Unexpected error during analysis for user %s: %s", user_id, e)
+        await update.message.reply_html(format_error_message(e))
 
-class BotFormatter:
-    """Formatter for Telegram bot responses."""
 
-    @staticmethod
-    def format_wallet_analysis(analysis: WalletAnalysis) -> str:
-        """Format wallet analysis for Telegram message.
+def format_wallet_analysis(analysis: WalletAnalysis) -> list[str]:
+    """Format wallet analysis for Telegram message.
 
-        Args:
-            analysis: WalletAnalysis object
+    The report is returned as sections that are meant to be joined with a
+    blank line. Every tag is opened and closed within one section, so the
+    sections are safe boundaries for splitting the report into messages.
 
-        Returns:
-            Formatted message string
+    Args:
+        analysis: WalletAnalysis object
 
-        """
-        message = (
-            f"💼 <b>Wallet Analysis Report</b>\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"<b>Address:</b>\n"
-            f"<code>{analysis.wallet_address}</code>\n\n"
-            f"<b>💰 ETH Balance</b>\n"
-            f"Balance: <code>{analysis.eth_balance_display} ETH</code>\n"
-        )
+    Returns:
+        List of formatted report sections
 
-        if analysis.usd_value:
-            message += f"Value: <code>${analysis.usd_value:,.2f}</code>\n"
+    """
+    ts = analysis.token_summary
+    trs = analysis.transaction_summary
+    bh = analysis.behavior
+    addr = analysis.wallet_address
+    top_tokens = ts.top_tokens[: Config.REPORT_TOP_TOKENS]
+    last_txs = trs.last_transactions[: Config.REPORT_LATEST_TRANSACTIONS]
+
+    sections: list[str] = [
+        f"{_REPORT_HEADER}\n{_SEP}",
+        f"<b>Address:</b>\n<code>{addr}</code>",
+    ]
+
+    balance = ["<b>💰 ETH Balance</b>", f"Balance: <code>{analysis.eth_balance_display} ETH</code>"]
+    if analysis.usd_value:
+        balance.append(f"Value: <code>${analysis.usd_value:,.2f}</code>")
+    sections.append("\n".join(balance))
+
+    # Token summary
+    tokens = [_TOKEN_HEADER, f"Total Tokens: <code>{ts.total_tokens_held}</code>"]
+    if top_tokens:
+        tokens.append("Top Tokens:")
+        for token in top_tokens:
+            tokens.append(f"  • {token.symbol}: <code>{token.balance_display}</code>")
+    sections.append("\n".join(tokens))
+
+    # Transaction summary
+    sections.append(
+        "\n".join((
+            _TX_HEADER,
+            f"Total Transactions: <code>{trs.total_transactions}</code>",
+            f"Unique Addresses: <code>{trs.unique_interacted_addresses}</code>",
+            f"Contract Interactions: <code>{trs.contract_interactions}</code>",
+            f"Failed Transactions: <code>{trs.failed_transactions}</code>",
+        ))
+    )
 
-        # Token summary
-        message += (
-            f"\n<b>🪙 Token Holdings</b>\n"
-            f"Total Tokens: <code>{analysis.token_summary.total_tokens_held}</code>\n"
-        )
+    # Recent transactions
+    if last_txs:
+        latest = [_LATEST_TX_HEADER]
+        for tx in last_txs:
+            direction = _ARROW_IN if tx.to_address and tx.to_address == addr else _ARROW_OUT
+            latest.append(
+                "".join((
+                    direction, " ", tx.value_display, " ETH - <code>", tx.hash[:10],
+                    "...</code> (",
+                    tx.timestamp_display or tx.timestamp.strftime("%Y-%m-%d"),
+                    ")",
+                ))
+            )
+        sections.append("\n".join(latest))
+
+    # Behavioral analysis
+    sections.append(
+        "\n".join((
+            _BEHAVIOR_HEADER,
+            f"Activity Level: <code>{bh.activity_level.value.upper()}</code>",
+            f"DeFi User: <code>{'Yes' if bh.defi_user else 'No'}</code>",
+            f"NFT Trader: <code>{'Yes' if bh.nft_trader else 'No'}</code>",
+            f"Contract Deployer: <code>{'Yes' if bh.contract_deployer else 'No'}</code>",
+            f"Wallet Score: <code>{bh.wallet_score}/100</code>",
+        ))
+    )
 
-        if analysis.token_summary.top_tokens:
-            message += f"Top Tokens:\n"
-            for token in analysis.token_summary.top_tokens[:5]:
-                message += (
-                    f"  • {token.symbol}: <code>{token.balance_display}</code>\n"
-                )
-
-        # Transaction summary
-        message += (
-            f"\n<b>📊 Transaction History</b>\n"
-            f"Total Transactions: <code>{analysis.transaction_summary.total_transactions}</code>\n"
-            f"Unique Addresses: <code>{analysis.transaction_summary.unique_interacted_addresses}</code>\n"
-            f"Contract Interactions: <code>{analysis.transaction_summary.contract_interactions}</code>\n"
-            f"Failed Transactions: <code>{analysis.transaction_summary.failed_transactions}</code>\n"
+    # Account age
+    if analysis.days_active is not None and analysis.first_transaction_date:
+        sections.append(
+            "\n".join((
+                _HISTORY_HEADER,
+                f"Active Days: <code>{analysis.days_active}</code>",
+                f"First Transaction: <code>"
+                f"{analysis.first_transaction_date.strftime('%Y-%m-%d')}</code>",
+            ))
         )
 
-        # Recent transactions
-        if analysis.transaction_summary.last_transactions:
-            message += f"\n<b>📝 Latest Transactions</b>\n"
-            for tx in analysis.transaction_summary.last_transactions[:3]:
-                direction = (
-                    "↓" if tx.to_address and tx.to_address == analysis.wallet_address else "↑"
-                )
-                message += (
-                    f"{direction} {tx.value_display} ETH - "
-                    f"<code>{tx.hash[:10]}...</code>"
-                    f" ({tx.timestamp.strftime('%Y-%m-%d')})\n"
-                )
-
-        # Behavioral analysis
-        message += (
-            f"\n<b>🎯 Behavioral Analysis</b>\n"
-            f"Activity Level: <code>{analysis.behavior.activity_level.value.upper()}</code>\n"
-            f"DeFi User: <code>{'Yes' if analysis.behavior.defi_user else 'No'}</code>\n"
-            f"NFT Trader: <code>{'Yes' if analysis.behavior.nft_trader else 'No'}</code>\n"
-            f"Contract Deployer: <code>{'Yes' if analysis.behavior.contract_deployer else 'No'}</code>\n"
-            f"Wallet Score: <code>{analysis.behavior.wallet_score}/100</code>\n"
-        )
+    sections.append(f"{_SEP}\nGenerated: {analysis.analyzed_at.strftime(_TS_FMT)}")
 
-        # Account age
-        if analysis.days_active is not None and analysis.first_transaction_date:
-            message += (
-                f"\n<b>📅 Account History</b>\n"
-                f"Active Days: <code>{analysis.days_active}</code>\n"
-                f"First Transaction: <code>"
-                f"{analysis.first_transaction_date.strftime('%Y-%m-%d')}</code>\n"
-            )
+    return sections
 
-        message += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        message += f"Generated: {analysis.analyzed_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
 
-        return message
+def format_welcome_message() -> str:
+    """Format welcome message.
 
-    @staticmethod
-    def format_welcome_message() -> str:
-        """Format welcome message.
+    Returns:
+        Welcome message
 
-        Returns:
-            Welcome message
+    """
+    return _WELCOME_MESSAGE
 
-        """
-        return (
-            "👋 <b>Welcome to EtherScope</b>\n\n"
-            "Your Web3 Wallet Intelligence Bot\n\n"
-            "<b>📖 Available Commands:</b>\n\n"
-            "/analyze [wallet_address]\n"
-            "  Analyze an Ethereum wallet address\n\n"
-            "/health\n"
-            "  Check bot health status\n\n"
-            "<b>💡 Example:</b>\n"
-            "/analyze 0x1234567890123456789012345678901234567890\n\n"
-            "Bot will provide detailed analysis including:\n"
-            "  • ETH balance and token holdings\n"
-            "  • Transaction statistics\n"
-            "  • DeFi and NFT activity detection\n"
-            "  • Behavioral classification\n"
-            "  • Overall wallet score\n"
-        )
 
-    @staticmethod
-    def format_error_message(error: Exception) -> str:
-        """Format error message for user.
+def format_error_message(error: Exception) -> str:
+    """Format error message for user.
 
-        Args:
-            error: Exception object
+    Args:
+        error: Exception object
 
-        Returns:
-            Formatted error message
+    Returns:
+        Formatted error message
 
-        """
-        if isinstance(error, InvalidWalletAddressError):
-            return (
-                f"❌ <b>Invalid Wallet Address</b>\n\n"
-                f"Error: {str(error)}\n\n"
-                f"Please provide a valid Ethereum address (42 characters starting with 0x)"
-            )
-        elif isinstance(error, BlockchainServiceError):
-            return (
-                f"❌ <b>Blockchain API Error</b>\n\n"
-                f"Failed to fetch blockchain data. Please try again later.\n\n"
-                f"Error: {str(error)}"
-            )
-        else:
-            return (
-                f"❌ <b>Analysis Error</b>\n\n"
-                f"An unexpected error occurred. Please try again later."
-            )
+    """
+    if isinstance(error, InvalidWalletAddressError):
+        return (
+            f"❌ <b>Invalid Wallet Address</b>\n\n"
+            f"Error: {str(error)}\n\n"
+            f"Please provide a valid Ethereum address (42 characters starting with 0x)"
+        )
+    elif isinstance(error, BlockchainServiceError):
+        return (
+            f"❌ <b>Blockchain API Error</b>\n\n"
+            f"Failed to fetch blockchain data. Please try again later.\n\n"
+            f"Error: {str(error)}"
+        )
+    else:
+        return (
+            f"❌ <b>Analysis Error</b>\n\n"
+            f"An unexpected error occurred. Please try again later."
+        )
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -254,22 +425,12 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     try:
         user_id = update.effective_user.id if update.effective_user else "unknown"
-        logger.info(f"User {user_id} started bot")
-        print(f"✅ /start command received from user {user_id}")
-
-        message = BotFormatter.format_welcome_message()
-        # create inline buttons for analyze and health
-        keyboard = [
-            [InlineKeyboardButton("🔍 Analyze Wallet", callback_data="analyze")],
-            [InlineKeyboardButton("📈 Health Check", callback_data="health")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.message.reply_html(message, reply_markup=reply_markup)
-        print(f"✅ Welcome message with buttons sent successfully")
+        logger.info("User %s started bot", user_id)
+
+        message = format_welcome_message()
+        await update.message.reply_html(message, reply_markup=_START_MARKUP)
     except Exception as e:
-        logger.error(f"Error in /start handler: {str(e)}", exc_info=True)
-        print(f"❌ Error in /start handler: {str(e)}")
+        logger.error("Error in /start handler: %s", e, exc_info=True)
         raise
 
 
@@ -278,122 +439,30 @@ async def analyze(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     This method delegates to :func:`perform_analysis` with the extracted
     wallet address.
-    """
-    """Handle /analyze command.
 
     Args:
         update: Telegram update
         context: Telegram context
 
     """
-    user_id = update.effective_user.id if update.effective_user else "unknown"
-
-    try:
-        # Determine wallet address either from command args or plain text
-        wallet_address: str | None = None
-        if context.args and len(context.args) > 0:
-            wallet_address = context.args[0].strip()
-        elif update.message and update.message.text:
-            # when called after pressing analyze button, user may send address
-            wallet_address = update.message.text.strip()
-
-        if not wallet_address:
-            await update.message.reply_html(
-                "❌ <b>Missing wallet address</b>\n\n"
-                "Usage: /analyze <wallet_address> or press the button below"
-            )
-            return
-
-        # perform actual analysis
-        await perform_analysis(update, context, wallet_address)
-        return
-
-        logger.info(
-            f"Analysis requested by user {user_id} for wallet {wallet_address}"
-        )
-
-        # Show typing indicator
-        await context.bot.send_chat_action(
-            chat_id=update.effective_chat.id,
-            action=ChatAction.TYPING,
-        )
-
-        # Validate address
-        wallet_address = BlockchainService.validate_address(wallet_address)
-
-        # Check cache
-        cache_key = f"analysis:{wallet_address}"
-        cached_analysis = cache_service.get(cache_key)
-
-        if cached_analysis:
-            logger.info(f"Returning cached analysis for {wallet_address}")
-            message = BotFormatter.format_wallet_analysis(cached_analysis)
-            # Split message if too long
-            for chunk in _split_message(message):
-                await update.message.reply_html(chunk)
-            return
-
-        # Fetch blockchain data
-        logger.debug(f"Fetching blockchain data for {wallet_address}")
-
-        eth_balance = await blockchain_service.get_eth_balance(wallet_address)
-        token_summary = await blockchain_service.get_erc20_tokens(wallet_address)
-        transaction_summary = await blockchain_service.get_transactions(wallet_address, limit=10)
-
-        # Analyze behavior
-        logger.debug(f"Analyzing wallet behavior for {wallet_address}")
-
-        behavior = AnalysisService.analyze_wallet_behavior(
-            transaction_summary=transaction_summary,
-            total_transactions=transaction_summary.total_transactions,
+    # Determine wallet address either from command args or plain text
+    wallet_address: str | None = None
+    if context.args and len(context.args) > 0:
+        wallet_address = context.args[0].strip()
+    elif update.message and update.message.text:
+        # when called after pressing analyze button, user may send address
+        wallet_address = update.message.text.strip()
+
+    if not wallet_address:
+        await update.message.reply_html(
+            "❌ <b>Missing wallet address</b>\n\n"
+            "Usage: /analyze <wallet_address> or press the button below"
         )
+        return
 
-        # Calculate days active
-        days_active, first_tx_date = AnalysisService.calculate_days_active(
-            transaction_summary.last_transactions
-        )
-
-        # Create analysis result
-        eth_balance_display = BlockchainService._format_ether(eth_balance)
-
-        analysis = WalletAnalysis(
-            wallet_address=wallet_address,
-            eth_balance=eth_balance,
-            eth_balance_display=eth_balance_display,
-            usd_value=None,  # USD conversion would require price API
-            token_summary=token_summary,
-            transaction_summary=transaction_summary,
-            behavior=behavior,
-            first_transaction_date=first_tx_date,
-            days_active=days_active,
-        )
-
-        # Cache result
-        cache_service.set(cache_key, analysis)
-
-        # Format and send response
-        message = BotFormatter.format_wallet_analysis(analysis)
-
-        # Split message if too long
-        for chunk in _split_message(message):
-            await update.message.reply_html(chunk)
-
-        logger.info(f"Analysis sent for wallet {wallet_address}")
-
-    except InvalidWalletAddressError as e:
-        logger.warning(f"Invalid wallet address from user {user_id}: {str(e)}")
-        message = BotFormatter.format_error_message(e)
-        await update.message.reply_html(message)
-
-    except BlockchainServiceError as e:
-        logger.error(f"Blockchain service error for user {user_id}: {str(e)}")
-        message = BotFormatter.format_error_message(e)
-        await update.message.reply_html(message)
-
-    except Exception as e:
-        logger.error(f"Unexpected error during analysis for user {user_id}: {str(e)}")
-        message = BotFormatter.format_error_message(e)
-        await update.message.reply_html(message)
+    # perform actual analysis in the chat's queue
+    chat_id = update.effective_chat.id if update.effective_chat else None
+    schedule(chat_id, lambda: perform_analysis(update, context, wallet_address))
 
 
 async def health(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -418,23 +487,20 @@ async def health(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     elif update.callback_query and update.callback_query.message:
         target = update.callback_query.message
 
-    logger.info(f"Health check from user {user_id}")
+    logger.info("Health check from user %s", user_id)
 
-    cache_stats = cache_service.get_stats()
+    cache_stats = get_cache_service().get_stats()
 
     status_message = (
-        f"✅ <b>EtherScope Bot Status</b>\n\n"
-        f"<b>System Information</b>\n"
-        f"Environment: <code>{Config.ENVIRONMENT}</code>\n"
-        f"Blockchain Provider: <code>{Config.BLOCKCHAIN_API_PROVIDER}</code>\n"
-        f"API Timeout: <code>{Config.API_TIMEOUT}s</code>\n\n"
-        f"<b>Cache Status</b>\n"
-        f"Enabled: <code>{'Yes' if cache_stats['enabled'] else 'No'}</code>\n"
-        f"Size: <code>{cache_stats['size']}/{cache_stats['max_size']}</code>\n"
-        f"Utilization: <code>{cache_stats['utilization']:.1%}</code>\n\n"
-        f"<b>Bot Status</b>\n"
-        f"Status: <code>🟢 Operational</code>\n"
-        f"Timestamp: <code>{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}</code>\n"
+        _HEALTH_HEADER
+        + _HEALTH_CACHE_FMT
+        % (
+            "Yes" if cache_stats["enabled"] else "No",
+            cache_stats["size"],
+            cache_stats["max_size"],
+            cache_stats["utilization"] * 100,
+        )
+        + _HEALTH_FOOTER_FMT % time.strftime(_TS_FMT, time.gmtime())
     )
 
     if target:
@@ -455,13 +521,13 @@ async def callback_router(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     try:
         await query.answer()
     except BadRequest as exc:  # telegram.error.BadRequest
-        logger.warning(f"Could not answer callback query, it may be too old: {exc}")
+        logger.warning("Could not answer callback query, it may be too old: %s", exc)
 
     user_id = query.from_user.id if query.from_user else None
 
     if query.data == "analyze":
         if user_id:
-            user_states[user_id] = "awaiting_wallet"
+            user_states.set(user_id, "awaiting_wallet")
         await query.message.reply_html("Please send the <b>wallet address</b> you want to analyze.")
     elif query.data == "health":
         # reuse health handler by crafting fake update
@@ -473,14 +539,55 @@ async def text_router(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     user_id = update.effective_user.id if update.effective_user else None
     if user_id and user_states.get(user_id) == "awaiting_wallet":
         address = update.message.text.strip()
-        user_states.pop(user_id, None)
-        await perform_analysis(update, context, address)
+        user_states.delete(user_id)
+        chat_id = update.effective_chat.id if update.effective_chat else None
+        schedule(chat_id, lambda: perform_analysis(update, context, address))
     else:
         # ignore or provide help
         await update.message.reply_text("Please use the buttons above or commands like /analyze <address>.")
 
 
-def _split_message(message: str, max_length: int = Config.TELEGRAM_MAX_MESSAGE_LENGTH) -> list[str]:
+def _pack_sections(sections: list[str], max_length: int = _MAX_LEN) -> list[str]:
+    """Join report sections into as few messages as fit the length limit.
+
+    Messages are only broken between sections, so HTML tags are never cut.
+    A single section that is itself too long falls back to
+    :func:`_split_message`.
+
+    Args:
+        sections: Report sections
+        max_length: Maximum length per message
+
+    Returns:
+        List of messages
+
+    """
+    messages: list[str] = []
+    current: list[str] = []
+    current_len = 0
+
+    for section in sections:
+        added_len = len(section) + (2 if current else 0)
+        if current and current_len + added_len > max_length:
+            messages.append("\n\n".join(current))
+            current = []
+            current_len = 0
+            added_len = len(section)
+
+        if added_len > max_length:
+            messages.extend(_split_message(section, max_length))
+            continue
+
+        current.append(section)
+        current_len += added_len
+
+    if current:
+        messages.append("\n\n".join(current))
+
+    return messages
+
+
+def _split_message(message: str, max_length: int = _MAX_LEN) -> list[str]:
     """Split long message into chunks.
 
     Args:
@@ -495,17 +602,20 @@ def _split_message(message: str, max_length: int = Config.TELEGRAM_MAX_MESSAGE_L
         return [message]
 
     chunks = []
-    current_chunk = ""
-
-    for line in message.split("\n"):
-        if len(current_chunk) + len(line) + 1 > max_length:
-            if current_chunk:
-                chunks.append(current_chunk)
-            current_chunk = line + "\n"
-        else:
-            current_chunk += line + "\n"
-
-    if current_chunk:
-        chunks.append(current_chunk)
+    chunk_start = 0
+    pos = 0
+    end = len(message)
+
+    # walk line boundaries and emit slices, so each chunk is allocated once
+    while pos < end:
+        line_end = message.find("\n", pos)
+        next_pos = end if line_end == -1 else line_end + 1
+        if next_pos - chunk_start > max_length and pos > chunk_start:
+            chunks.append(message[chunk_start:pos])
+            chunk_start = pos
+        pos = next_pos
+
+    if chunk_start < end:
+        chunks.append(message[chunk_start:])
 
     return chunks
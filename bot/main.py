@@ -5,6 +5,8 @@ from telegram.ext import Application, CommandHandler, CallbackQueryHandler, Mess
 from core.config import Config
 from core.logger import get_logger
 
+from services.blockchain_service import close_http_client
+
 from .handlers import analyze, health, start, callback_router, text_router
 
 logger = get_logger(__name__)
@@ -25,10 +27,14 @@ class EtherScopeBot:
 
         """
         logger.info("Creating EtherScope bot application")
-        print("   Creating bot application...")
 
         # Create application with bot token
-        self.app = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+        self.app = (
+            Application.builder()
+            .token(Config.TELEGRAM_BOT_TOKEN)
+            .post_shutdown(self._on_shutdown)
+            .build()
+        )
 
         # Register command handlers
         self._register_handlers()
@@ -42,7 +48,6 @@ class EtherScopeBot:
             raise RuntimeError("Application not initialized")
 
         logger.debug("Registering command handlers")
-        print(f"   Registering command handlers...")
 
         # Add handlers
         self.app.add_handler(CommandHandler("start", start))
@@ -55,4 +60,9 @@ class EtherScopeBot:
     
 
         logger.debug("Command handlers registered: /start, /analyze, /health")
-        print(f"   ✅ Handlers registered: /start, /analyze, /health")
+
+    @staticmethod
+    async def _on_shutdown(app: Application) -> None:
+        """Release pooled connections when the application stops."""
+        logger.info("Closing blockchain service HTTP client")
+        await close_http_client()
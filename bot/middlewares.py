@@ -35,12 +35,12 @@ class RequestLoggingMiddleware:
         if update.message:
             text = update.message.text or ""
             logger.info(
-                f"Message from user {user_id} in chat {chat_id}: {text[:50]}"
+                "Message from user %s in chat %s: %s", user_id, chat_id, text[:50]
             )
         elif update.callback_query:
             data = update.callback_query.data or ""
             logger.info(
-                f"Callback query from user {user_id}: {data}"
+                "Callback query from user %s: %s", user_id, data
             )
 
         return await next_handler(update, context)
@@ -64,15 +64,15 @@ class PerformanceMiddleware:
             Result from next handler
 
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         user_id = update.effective_user.id if update.effective_user else "unknown"
 
         try:
             result = await next_handler(update, context)
         finally:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.debug(
-                f"Request from user {user_id} completed in {elapsed:.2f}s"
+                "Request from user %s completed in %.2fs", user_id, elapsed
             )
 
         return result
@@ -101,7 +101,7 @@ class ErrorHandlingMiddleware:
         except Exception as e:
             user_id = update.effective_user.id if update.effective_user else "unknown"
             logger.error(
-                f"Unhandled error processing update from user {user_id}: {str(e)}",
+                "Unhandled error processing update from user %s: %s", user_id, e,
                 exc_info=True,
             )
             # Send error message to user
@@ -112,6 +112,6 @@ class ErrorHandlingMiddleware:
                         "Please try again later or contact support."
                     )
                 except Exception as send_error:
-                    logger.error(f"Failed to send error message: {str(send_error)}")
+                    logger.error("Failed to send error message: %s", send_error)
 
             raise
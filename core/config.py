@@ -31,11 +31,26 @@ class Config:
     API_MAX_RETRIES: int = 3
     API_RETRY_DELAY: float = 1.0
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 60
+    RPC_POOL_SIZE: int = int(os.getenv("RPC_POOL_SIZE", "20"))
+    RPC_KEEPALIVE_CONNECTIONS: int = int(os.getenv("RPC_KEEPALIVE_CONNECTIONS", "20"))
+    RPC_KEEPALIVE_EXPIRY: float = float(os.getenv("RPC_KEEPALIVE_EXPIRY", "300"))
+    # only takes effect when the h2 package (httpx[http2]) is installed
+    RPC_HTTP2: bool = os.getenv("RPC_HTTP2", "true").lower() == "true"
 
     # Cache
     CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
     CACHE_TTL_SECONDS: int = 300  # 5 minutes
     CACHE_MAX_SIZE: int = 1000
+    # "ttl": serve cached analyses until the TTL expires
+    # "tx_count": also revalidate cached analyses against the wallet's nonce on every hit;
+    # costs one API call per hit and misses incoming transfers, which leave the nonce alone
+    CACHE_SIGNATURE_STRATEGY: str = os.getenv("CACHE_SIGNATURE_STRATEGY", "ttl")
+    # Directory for the persistent second cache tier (needs the "disk" extra); unset disables it
+    CACHE_DISK_PATH: Optional[str] = os.getenv("CACHE_DISK_PATH") or None
+
+    # Conversation state (e.g. waiting for a wallet address after a button press)
+    USER_STATE_TTL_SECONDS: int = 300
+    USER_STATE_MAX_SIZE: int = 10_000
 
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -46,6 +61,10 @@ class Config:
     DEFI_CONTRACT_THRESHOLD: int = 5
     WALLET_SCORE_MAX: int = 100
 
+    # Report
+    REPORT_TOP_TOKENS: int = 5
+    REPORT_LATEST_TRANSACTIONS: int = 3
+
     # Environment
     DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "production")
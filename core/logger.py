@@ -1,13 +1,34 @@
 """Structured logging configuration for EtherScope."""
 
-import json
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+import orjson
+
 from .config import Config
 
+# Optional context fields copied from a record's ``extra`` when present
+_OPT_KEYS = ("user_id", "wallet_address", "request_id")
+
+
+class ContextLogRecord(logging.LogRecord):
+    """Log record that always carries the optional context fields.
+
+    The defaults live on the class rather than the instance, so ``extra``
+    can still set them (``Logger.makeRecord`` refuses keys already in the
+    instance ``__dict__``) and formatters never hit a missing attribute.
+    """
+
+    user_id: Any = None
+    wallet_address: Any = None
+    request_id: Any = None
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
@@ -15,7 +36,7 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,18 +46,20 @@ class StructuredFormatter(logging.Formatter):
         }
 
         # Add extra fields if present
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, "wallet_address"):
-            log_data["wallet_address"] = record.wallet_address
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
+        for key in _OPT_KEYS:
+            value = getattr(record, key, None)
+            if value is not None:
+                log_data[key] = value
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return orjson.dumps(
+            log_data,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        ).decode()
 
 
 class SimpleFormatter(logging.Formatter):
@@ -50,11 +73,46 @@ class SimpleFormatter(logging.Formatter):
         )
 
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves record formatting to the listener thread.
+
+    The stock QueueHandler runs the full formatter in the calling thread and
+    drops ``exc_info``. Only ``msg % args`` is merged here, so arguments are
+    captured as they are at call time even if they are mutated later; the
+    real formatter still runs on the listener and sees the exception.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record with its message arguments merged."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that writes queued records, see setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def setup_logging(
     log_level: Optional[str] = None, log_format: Optional[str] = None
 ) -> logging.Logger:
     """Configure application logging.
 
+    Records are put on a queue and written to stdout by a background
+    listener thread, so logging calls never block on the write itself.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Log format type ('structured' for JSON, 'simple' for text)
@@ -63,14 +121,19 @@ def setup_logging(
         Configured logger instance
 
     """
+    global _listener
+
     log_level = log_level or Config.LOG_LEVEL
     log_format = log_format or Config.LOG_FORMAT
 
+    logging.setLogRecordFactory(ContextLogRecord)
+
     logger = logging.getLogger("EtherScope")
     logger.setLevel(getattr(logging, log_level.upper()))
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener()
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -83,7 +146,13 @@ def setup_logging(
         formatter = SimpleFormatter()
 
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(DeferredQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
 
@@ -0,0 +1,106 @@
+"""Example payloads for the EtherScope models' JSON schemas.
+
+The examples only matter when schemas are introspected, so they are attached to
+the models outside production and kept off the classes otherwise.
+"""
+
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from core.config import Config
+
+_ModelT = TypeVar("_ModelT", bound=type[BaseModel])
+
+EXAMPLES: dict[str, dict[str, Any]] = {
+    "Token": {
+        "contract_address": "0xdac17f958d2ee523a2206206994597c13d831ec7",
+        "name": "Tether USD",
+        "symbol": "USDT",
+        "decimals": 6,
+        "balance": "1000000000",
+        "balance_display": "1000.0",
+        "usd_value": 1000.0,
+    },
+    "TokenSummary": {
+        "top_tokens": [],
+        "total_tokens_held": 5,
+        "total_usd_value": 50000.0,
+    },
+    "Transaction": {
+        "hash": "0x1234567890abcdef",
+        "from_address": "0xfrom",
+        "to_address": "0xto",
+        "value": "1000000000000000000",
+        "value_display": "1.0",
+        "gas_price": "20000000000",
+        "gas_used": "21000",
+        "timestamp": "2024-01-01T00:00:00",
+        "timestamp_display": "2024-01-01",
+        "block_number": 1000000,
+        "is_error": False,
+        "type": "send",
+        "method_id": "0xa9059cbb",
+    },
+    "TransactionSummary": {
+        "total_transactions": 150,
+        "last_transactions": [],
+        "unique_interacted_addresses": 45,
+        "contract_interactions": 30,
+        "failed_transactions": 2,
+    },
+    "WalletBehavior": {
+        "activity_level": "active",
+        "defi_user": True,
+        "nft_trader": False,
+        "contract_deployer": False,
+        "wallet_score": 75,
+    },
+    "WalletAnalysis": {
+        "wallet_address": "0x1234567890123456789012345678901234567890",
+        "eth_balance": "1000000000000000000",
+        "eth_balance_display": "1.0",
+        "usd_value": 1500.0,
+        "token_summary": {
+            "top_tokens": [],
+            "total_tokens_held": 5,
+            "total_usd_value": 50000.0,
+        },
+        "transaction_summary": {
+            "total_transactions": 150,
+            "last_transactions": [],
+            "unique_interacted_addresses": 45,
+            "contract_interactions": 30,
+            "failed_transactions": 2,
+        },
+        "behavior": {
+            "activity_level": "active",
+            "defi_user": True,
+            "nft_trader": False,
+            "contract_deployer": False,
+            "wallet_score": 75,
+        },
+        "analyzed_at": "2024-01-01T00:00:00",
+        "first_transaction_date": "2022-01-01T00:00:00",
+        "days_active": 730,
+    },
+}
+
+
+def with_examples(name: str) -> Callable[[_ModelT], _ModelT]:
+    """Attach ``EXAMPLES[name]`` as the model's schema example outside production.
+
+    Args:
+        name: Key of the example in EXAMPLES
+
+    Returns:
+        Class decorator
+
+    """
+
+    def decorate(cls: _ModelT) -> _ModelT:
+        if Config.ENVIRONMENT != "production":
+            cls.model_config["json_schema_extra"] = {"example": EXAMPLES[name]}
+        return cls
+
+    return decorate
@@ -6,6 +6,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from ._examples import with_examples
+
 
 class TransactionType(str, Enum):
     """Transaction types."""
@@ -17,6 +19,7 @@ class TransactionType(str, Enum):
     NFT_TRANSFER = "nft_transfer"
 
 
+@with_examples("Transaction")
 class Transaction(BaseModel):
     """Blockchain transaction model."""
 
@@ -28,32 +31,16 @@ class Transaction(BaseModel):
     gas_price: str = Field(..., description="Gas price in Wei")
     gas_used: Optional[str] = Field(None, description="Gas used in Wei")
     timestamp: datetime = Field(..., description="Transaction timestamp")
+    timestamp_display: str = Field(
+        default="", description="Transaction date (YYYY-MM-DD), formatted at ingestion"
+    )
     block_number: int = Field(..., description="Block number")
     is_error: bool = Field(default=False, description="Whether transaction failed")
     type: TransactionType = Field(..., description="Transaction type")
     method_id: Optional[str] = Field(None, description="Function method ID for contract calls")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "hash": "0x1234567890abcdef",
-                "from_address": "0xfrom",
-                "to_address": "0xto",
-                "value": "1000000000000000000",
-                "value_display": "1.0",
-                "gas_price": "20000000000",
-                "gas_used": "21000",
-                "timestamp": "2024-01-01T00:00:00",
-                "block_number": 1000000,
-                "is_error": False,
-                "type": "send",
-                "method_id": "0xa9059cbb",
-            }
-        }
-
 
+@with_examples("TransactionSummary")
 class TransactionSummary(BaseModel):
     """Summary of transaction activity."""
 
@@ -66,16 +53,3 @@ class TransactionSummary(BaseModel):
     )
     contract_interactions: int = Field(..., description="Number of contract interactions")
     failed_transactions: int = Field(..., description="Number of failed transactions")
-
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "total_transactions": 150,
-                "last_transactions": [],
-                "unique_interacted_addresses": 45,
-                "contract_interactions": 30,
-                "failed_transactions": 2,
-            }
-        }
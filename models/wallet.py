@@ -1,15 +1,29 @@
 """Pydantic models for wallets."""
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field, validator
 
+from ._examples import with_examples
 from .token import TokenSummary
 from .transaction import TransactionSummary
 
 
+_ADDR_RE = re.compile(r"\A0x[0-9a-fA-F]{40}\Z").match
+# addresses are ASCII hex once _ADDR_RE matched, so only A-F need folding
+_HEX_LOWER = str.maketrans("ABCDEF", "abcdef")
+
+
+def _normalize_address(v: str) -> str:
+    """Validate Ethereum address format and return it lowercased."""
+    if not _ADDR_RE(v):
+        raise ValueError("Invalid Ethereum address format")
+    return v.translate(_HEX_LOWER)
+
+
 class ActivityLevel(str, Enum):
     """Wallet activity levels."""
 
@@ -20,6 +34,7 @@ class ActivityLevel(str, Enum):
     HIGHLY_ACTIVE = "highly_active"
 
 
+@with_examples("WalletBehavior")
 class WalletBehavior(BaseModel):
     """Behavioral analysis of wallet."""
 
@@ -29,20 +44,8 @@ class WalletBehavior(BaseModel):
     contract_deployer: bool = Field(..., description="Whether wallet deployed contracts")
     wallet_score: int = Field(..., ge=0, le=100, description="Overall wallet score (0-100)")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "activity_level": "active",
-                "defi_user": True,
-                "nft_trader": False,
-                "contract_deployer": False,
-                "wallet_score": 75,
-            }
-        }
-
 
+@with_examples("WalletAnalysis")
 class WalletAnalysis(BaseModel):
     """Complete wallet analysis."""
 
@@ -62,44 +65,23 @@ class WalletAnalysis(BaseModel):
     @validator("wallet_address")
     def validate_address(cls, v: str) -> str:
         """Validate Ethereum address format."""
-        if not v.startswith("0x") or len(v) != 42:
-            raise ValueError("Invalid Ethereum address format")
-        try:
-            int(v, 16)
-        except ValueError:
-            raise ValueError("Invalid Ethereum address format")
-        return v.lower()
-
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "wallet_address": "0x1234567890123456789012345678901234567890",
-                "eth_balance": "1000000000000000000",
-                "eth_balance_display": "1.0",
-                "usd_value": 1500.0,
-                "token_summary": {
-                    "top_tokens": [],
-                    "total_tokens_held": 5,
-                    "total_usd_value": 50000.0,
-                },
-                "transaction_summary": {
-                    "total_transactions": 150,
-                    "last_transactions": [],
-                    "unique_interacted_addresses": 45,
-                    "contract_interactions": 30,
-                    "failed_transactions": 2,
-                },
-                "behavior": {
-                    "activity_level": "active",
-                    "defi_user": True,
-                    "nft_trader": False,
-                    "contract_deployer": False,
-                    "wallet_score": 75,
-                },
-                "analyzed_at": "2024-01-01T00:00:00",
-                "first_transaction_date": "2022-01-01T00:00:00",
-                "days_active": 730,
-            }
-        }
+        return _normalize_address(v)
+
+    @classmethod
+    def build_trusted(cls, wallet_address: str, **fields) -> "WalletAnalysis":
+        """Assemble an analysis from already-validated service output.
+
+        Trust boundary: everything except ``wallet_address`` comes from our own
+        services and sub-models that were validated when they were built, so
+        full validation is skipped. ``wallet_address`` originates from user
+        input and is still checked and normalised here.
+
+        Args:
+            wallet_address: Wallet address as supplied by the user
+            **fields: Remaining model fields
+
+        Returns:
+            Constructed wallet analysis
+
+        """
+        return cls.model_construct(wallet_address=_normalize_address(wallet_address), **fields)
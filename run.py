@@ -1,5 +1,7 @@
 """Entry point for EtherScope Telegram bot."""
 
+import sys
+
 from bot.main import EtherScopeBot
 from core.config import Config
 from core.logger import get_logger, setup_logging
@@ -9,28 +11,56 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+_RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+_HEADER = "\n" + "=" * 60 + "\n🤖 EtherScope - Web3 Wallet Intelligence Bot\n" + "=" * 60 + "\n"
+
+_RUNNING = "\n".join(
+    [
+        "",
+        "✅ Bot application created successfully",
+        "",
+        _RULE,
+        "🚀 Bot is now RUNNING and listening for messages...",
+        _RULE,
+        "",
+        "📱 Open Telegram and send these commands to your bot:",
+        "   /start - Show welcome message",
+        "   /analyze <wallet_address> - Analyze a wallet",
+        "   /health - Check bot status",
+        "",
+        "💡 Example:",
+        "   /analyze 0xd8da6bf26964af9d7eed9e03e53415d37aa96045",
+        "",
+        "⏹️  Press Ctrl+C to stop the bot",
+        _RULE,
+        "",
+        "",
+    ]
+)
+
+
 def main() -> None:
     """Main entry point for the bot."""
-    logger.info("=" * 60)
-    logger.info("Starting EtherScope - Web3 Wallet Intelligence Bot")
-    logger.info("=" * 60)
-    
-    print("\n" + "=" * 60)
-    print("🤖 EtherScope - Web3 Wallet Intelligence Bot")
-    print("=" * 60)
+    logger.info(
+        "%s\nStarting EtherScope - Web3 Wallet Intelligence Bot\n%s", "=" * 60, "=" * 60
+    )
+
+    sys.stdout.write(_HEADER)
+    sys.stdout.flush()
 
     # Validate configuration
     try:
         Config.validate()
-        logger.info(f"Configuration validated successfully")
-        logger.info(f"  - Environment: {Config.ENVIRONMENT}")
-        logger.info(f"  - Blockchain Provider: {Config.BLOCKCHAIN_API_PROVIDER}")
-        logger.info(f"  - Cache Enabled: {Config.CACHE_ENABLED}")
-        
-        print(f"\n✅ Configuration validated!")
-        print(f"   Environment: {Config.ENVIRONMENT}")
-        print(f"   Blockchain Provider: {Config.BLOCKCHAIN_API_PROVIDER}")
-        print(f"   Cache Enabled: {Config.CACHE_ENABLED}")
+        logger.info(
+            "Configuration validated successfully\n"
+            "  - Environment: %s\n"
+            "  - Blockchain Provider: %s\n"
+            "  - Cache Enabled: %s",
+            Config.ENVIRONMENT,
+            Config.BLOCKCHAIN_API_PROVIDER,
+            Config.CACHE_ENABLED,
+        )
     except Exception as e:
         logger.error(f"Configuration validation failed: {str(e)}")
         raise
@@ -38,20 +68,16 @@ def main() -> None:
     # Create bot
     bot = EtherScopeBot()
     app = bot.create_app()
-    
-    print(f"\n✅ Bot application created successfully")
-    print(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print(f"🚀 Bot is now RUNNING and listening for messages...")
-    print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print(f"\n📱 Open Telegram and send these commands to your bot:")
-    print(f"   /start - Show welcome message")
-    print(f"   /analyze <wallet_address> - Analyze a wallet")
-    print(f"   /health - Check bot status")
-    print(f"\n💡 Example:")
-    print(f"   /analyze 0xd8da6bf26964af9d7eed9e03e53415d37aa96045")
-    print(f"\n⏹️  Press Ctrl+C to stop the bot")
-    print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-    
+
+    # one write for the whole startup summary
+    sys.stdout.write(
+        "\n✅ Configuration validated!\n"
+        f"   Environment: {Config.ENVIRONMENT}\n"
+        f"   Blockchain Provider: {Config.BLOCKCHAIN_API_PROVIDER}\n"
+        f"   Cache Enabled: {Config.CACHE_ENABLED}\n" + _RUNNING
+    )
+    sys.stdout.flush()
+
     # Run the bot (this will manage the event loop internally)
     app.run_polling(allowed_updates=["message", "callback_query"], drop_pending_updates=False)
 
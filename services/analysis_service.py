@@ -1,6 +1,7 @@
 """Wallet analysis service for EtherScope."""
 
 from datetime import datetime, timedelta
+from typing import Iterable, NamedTuple, Optional
 
 from core.config import Config
 from core.logger import get_logger
@@ -25,6 +26,33 @@ DEFI_KEYWORDS = [
 # Known NFT contract addresses (simplified set)
 NFT_CONTRACT_PATTERNS = ["0x" + "0" * 40]  # Placeholder
 
+# ERC-721 / ERC-1155 transfer selectors (safeTransferFrom variants,
+# safeBatchTransferFrom). transferFrom (0x23b872dd) is left out on purpose:
+# ERC-20 shares it, so it says nothing about NFTs on its own
+_NFT_METHOD_IDS = frozenset({"0xf242432a", "0x2eb2c2d6", "0x42842e0e", "0xb88d4fde"})
+
+# Transaction frequency component of the wallet score (40 points)
+_ACTIVITY_SCORES: dict[ActivityLevel, int] = {
+    ActivityLevel.DORMANT: 0,
+    ActivityLevel.LOW: 10,
+    ActivityLevel.MODERATE: 20,
+    ActivityLevel.ACTIVE: 30,
+    ActivityLevel.HIGHLY_ACTIVE: 40,
+}
+
+# Contract interaction ratio score, indexed by the ratio's tenths bucket (capped at 10):
+# >= 0.5 -> 30, >= 0.3 -> 20, >= 0.1 -> 10, otherwise 5
+_RATIO_TBL = (5, 10, 10, 20, 20, 30, 30, 30, 30, 30, 30)
+
+
+class _TxStats(NamedTuple):
+    """Per-wallet transaction counters gathered in one pass."""
+
+    total: int
+    contract_interactions: int
+    nft_interactions: int
+    deployments: int
+
 
 class AnalysisService:
     """Service for analyzing wallet behavior and characteristics."""
@@ -57,11 +85,55 @@ class AnalysisService:
             return ActivityLevel.DORMANT
 
     @staticmethod
-    def detect_defi_usage(transactions: list[Transaction]) -> bool:
+    def aggregate_stream(tx_iter: Iterable[Transaction]) -> _TxStats:
+        """Collect all per-transaction counters in a single pass.
+
+        Only iterates once, so transactions can be fed from a generator without
+        materialising a list first.
+
+        Args:
+            tx_iter: Iterable of transactions
+
+        Returns:
+            Aggregated transaction counters
+
+        """
+        total = 0
+        contract_interactions = 0
+        nft_interactions = 0
+        deployments = 0
+
+        for tx in tx_iter:
+            total += 1
+            method_id = tx.method_id
+            if method_id and method_id != "0x":
+                # Contract interaction (non-zero input data)
+                contract_interactions += 1
+                # Look for common NFT transfer selectors
+                # This is a simplified implementation
+                if method_id in _NFT_METHOD_IDS:
+                    nft_interactions += 1
+            # Contract deployment typically has empty 'to' address
+            if tx.to_address is None:
+                deployments += 1
+
+        return _TxStats(
+            total=total,
+            contract_interactions=contract_interactions,
+            nft_interactions=nft_interactions,
+            deployments=deployments,
+        )
+
+    @staticmethod
+    def detect_defi_usage(
+        transactions: list[Transaction], contract_interactions: Optional[int] = None
+    ) -> bool:
         """Detect if wallet has interacted with DeFi protocols.
 
         Args:
             transactions: List of transactions
+            contract_interactions: Precomputed number of contract interactions in
+                ``transactions``, e.g. from TransactionSummary; counted if omitted
 
         Returns:
             True if DeFi usage detected
@@ -70,10 +142,10 @@ class AnalysisService:
         if not transactions:
             return False
 
-        # Check for contract interactions (non-zero input data)
-        contract_interactions = sum(
-            1 for tx in transactions if tx.method_id and tx.method_id != "0x"
-        )
+        if contract_interactions is None:
+            contract_interactions = AnalysisService.aggregate_stream(
+                transactions
+            ).contract_interactions
 
         # Simple heuristic: if more than 20% of transactions are contract interactions,
         # likely a DeFi user
@@ -81,8 +153,10 @@ class AnalysisService:
         is_defi_user = contract_interactions >= max(defi_threshold, Config.DEFI_CONTRACT_THRESHOLD)
 
         logger.debug(
-            f"DeFi detection: {contract_interactions} contract interactions "
-            f"out of {len(transactions)} transactions. DeFi user: {is_defi_user}"
+            "DeFi detection: %d contract interactions out of %d transactions. DeFi user: %s",
+            contract_interactions,
+            len(transactions),
+            is_defi_user,
         )
 
         return is_defi_user
@@ -98,16 +172,14 @@ class AnalysisService:
             True if NFT trading detected
 
         """
-        if not transactions:
-            return False
+        return AnalysisService._is_nft_trader(AnalysisService.aggregate_stream(transactions))
 
-        # Look for common NFT contract interaction patterns
-        # This is a simplified implementation
-        nft_interactions = sum(1 for tx in transactions if "nft" in str(tx.method_id or "").lower())
-
-        is_nft_trader = nft_interactions > 0
+    @staticmethod
+    def _is_nft_trader(stats: _TxStats) -> bool:
+        """Apply the NFT trading heuristic to aggregated transaction counters."""
+        is_nft_trader = stats.nft_interactions > 0
 
-        logger.debug(f"NFT trading detection: {nft_interactions} NFT interactions detected")
+        logger.debug("NFT trading detection: %d NFT interactions detected", stats.nft_interactions)
 
         return is_nft_trader
 
@@ -122,15 +194,16 @@ class AnalysisService:
             True if contract deployment detected
 
         """
-        if not transactions:
-            return False
-
-        # Contract deployment typically has empty 'to' address
-        deployments = sum(1 for tx in transactions if tx.to_address is None)
+        return AnalysisService._is_contract_deployer(
+            AnalysisService.aggregate_stream(transactions)
+        )
 
-        is_deployer = deployments > 0
+    @staticmethod
+    def _is_contract_deployer(stats: _TxStats) -> bool:
+        """Apply the contract deployment heuristic to aggregated transaction counters."""
+        is_deployer = stats.deployments > 0
 
-        logger.debug(f"Contract deployment detection: {deployments} deployments found")
+        logger.debug("Contract deployment detection: %d deployments found", stats.deployments)
 
         return is_deployer
 
@@ -164,27 +237,13 @@ class AnalysisService:
         score = 0
 
         # Transaction frequency component (40 points)
-        activity_scores = {
-            ActivityLevel.DORMANT: 0,
-            ActivityLevel.LOW: 10,
-            ActivityLevel.MODERATE: 20,
-            ActivityLevel.ACTIVE: 30,
-            ActivityLevel.HIGHLY_ACTIVE: 40,
-        }
-        score += activity_scores.get(activity_level, 0)
+        score += _ACTIVITY_SCORES.get(activity_level, 0)
 
         # Contract interactions component (30 points)
         contract_interaction_ratio = (
             transaction_summary.contract_interactions / max(transaction_summary.total_transactions, 1)
         )
-        if contract_interaction_ratio >= 0.5:
-            score += 30
-        elif contract_interaction_ratio >= 0.3:
-            score += 20
-        elif contract_interaction_ratio >= 0.1:
-            score += 10
-        else:
-            score += 5
+        score += _RATIO_TBL[min(int(contract_interaction_ratio * 10), 10)]
 
         # Token diversity component (15 points)
         # More tokens = higher score (cap at 15)
@@ -199,7 +258,7 @@ class AnalysisService:
         # Cap at 100
         final_score = min(score, 100)
 
-        logger.debug(f"Wallet score calculated: {final_score} (breakdowne: components above)")
+        logger.debug("Wallet score calculated: %d", final_score)
 
         return final_score
 
@@ -217,16 +276,19 @@ class AnalysisService:
             WalletBehavior object with analysis results
 
         """
-        logger.debug(f"Starting wallet behavior analysis for {total_transactions} transactions")
+        logger.debug("Starting wallet behavior analysis for %d transactions", total_transactions)
 
         # Get all transactions for analysis
         recent_transactions = transaction_summary.last_transactions
 
-        # Detect patterns
+        # Detect patterns; the counters behind them are gathered in one pass
+        stats = AnalysisService.aggregate_stream(recent_transactions)
         activity_level = AnalysisService.detect_activity_level(recent_transactions)
-        defi_user = AnalysisService.detect_defi_usage(recent_transactions)
-        nft_trader = AnalysisService.detect_nft_trader(recent_transactions)
-        contract_deployer = AnalysisService.detect_contract_deployer(recent_transactions)
+        defi_user = AnalysisService.detect_defi_usage(
+            recent_transactions, transaction_summary.contract_interactions
+        )
+        nft_trader = AnalysisService._is_nft_trader(stats)
+        contract_deployer = AnalysisService._is_contract_deployer(stats)
 
         # Calculate score
         wallet_score = AnalysisService.calculate_wallet_score(
@@ -237,7 +299,8 @@ class AnalysisService:
             contract_deployer=contract_deployer,
         )
 
-        behavior = WalletBehavior(
+        # All inputs are computed above, so skip pydantic validation
+        behavior = WalletBehavior.model_construct(
             activity_level=activity_level,
             defi_user=defi_user,
             nft_trader=nft_trader,
@@ -245,30 +308,42 @@ class AnalysisService:
             wallet_score=wallet_score,
         )
 
-        logger.debug(f"Wallet behavior analysis complete: {behavior}")
+        logger.debug("Wallet behavior analysis complete: %s", behavior)
 
         return behavior
 
     @staticmethod
-    def calculate_days_active(transactions: list[Transaction]) -> tuple[int, datetime]:
+    def calculate_days_active(
+        transactions: list[Transaction],
+        sorted_desc: bool = False,
+        now: Optional[datetime] = None,
+    ) -> tuple[int, datetime]:
         """Calculate days account has been active and first transaction date.
 
         Args:
             transactions: List of transactions
+            sorted_desc: Whether transactions are already ordered newest first,
+                as returned by BlockchainService.get_transactions
+            now: Reference time shared with the rest of the analysis (defaults to utcnow)
 
         Returns:
             Tuple of (days_active, first_transaction_date)
 
         """
+        if now is None:
+            now = datetime.utcnow()
+
         if not transactions:
-            return 0, datetime.utcnow()
+            return 0, now
 
         # Find oldest transaction
-        oldest_tx = min(transactions, key=lambda t: t.timestamp)
-        first_tx_date = oldest_tx.timestamp
+        if sorted_desc:
+            first_tx_date = transactions[-1].timestamp
+        else:
+            first_tx_date = min(tx.timestamp for tx in transactions)
 
-        days_active = (datetime.utcnow() - first_tx_date).days
+        days_active = (now - first_tx_date).days
 
-        logger.debug(f"Wallet active for {days_active} days since {first_tx_date}")
+        logger.debug("Wallet active for %d days since %s", days_active, first_tx_date)
 
         return days_active, first_tx_date
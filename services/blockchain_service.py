@@ -1,15 +1,22 @@
 """Blockchain API service for EtherScope."""
 
 import asyncio
+import heapq
+import importlib.util
+import random
 import re
+import time
 from datetime import datetime
-from typing import Optional
+from operator import itemgetter
+from typing import Any, Optional
 
 import httpx
+import orjson
 
 from core.config import Config
 from core.exceptions import (
     BlockchainAPIError,
+    BlockchainServiceError,
     InvalidWalletAddressError,
     RateLimitError,
 )
@@ -19,10 +26,101 @@ from models.transaction import Transaction, TransactionSummary, TransactionType
 
 logger = get_logger(__name__)
 
+# Normalised (lowercase) Ethereum address
+_ADDRESS_RE = re.compile(r"\A0x[0-9a-f]{40}\Z")
+
+_ALCHEMY_HEADERS = {"accept": "application/json", "content-type": "application/json"}
+
+# Wei per ether, and how many decimal places balances are shown with
+_ETH_DECIMALS = 18
+_DISPLAY_DECIMALS = 6
+_DISPLAY_UNIT = 10**_DISPLAY_DECIMALS
+
+
+def _format_units(value: int, decimals: int) -> str:
+    """Format an integer amount of base units, rounded to six decimal places.
+
+    Pure integer arithmetic, so amounts beyond float precision stay exact.
+    """
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    if decimals > _DISPLAY_DECIMALS:
+        # round half up to the displayed precision
+        scale = 10 ** (decimals - _DISPLAY_DECIMALS)
+        value = (value + scale // 2) // scale
+    else:
+        value *= 10 ** (_DISPLAY_DECIMALS - decimals)
+    whole, frac = divmod(value, _DISPLAY_UNIT)
+    if not (whole or frac):
+        return "0"
+    return f"{sign}{whole}.{frac:06d}".rstrip("0").rstrip(".")
+
+
+def _transfer_value(tx: dict) -> int:
+    """Raw amount of an Etherscan token transfer row, 0 if it isn't an integer."""
+    value = tx.get("value", "0")
+    return int(value) if value.isdigit() else 0
+
+
+# httpx only speaks HTTP/2 with the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared HTTP client, see get_http_client
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client, creating it on first use.
+
+    Reusing one client keeps connections alive between API calls, so
+    concurrent lookups don't each pay for a new TCP/TLS handshake.
+
+    Returns:
+        Shared AsyncClient instance
+
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # pool settings go on the transport: httpx ignores the client's
+        # http2/limits arguments once a custom transport is passed
+        transport = httpx.AsyncHTTPTransport(
+            # retries failed connection attempts; status-code retries stay in _make_request
+            retries=2,
+            http2=Config.RPC_HTTP2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=Config.RPC_POOL_SIZE,
+                max_keepalive_connections=Config.RPC_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Config.RPC_KEEPALIVE_EXPIRY,
+            ),
+        )
+        # httpx already asks for gzip/deflate responses by default
+        _http_client = httpx.AsyncClient(timeout=Config.API_TIMEOUT, transport=transport)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, e.g. on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class BlockchainService:
     """Service for interacting with blockchain APIs."""
 
+    # Constant parts of the Etherscan query for each action
+    _BAL_PARAMS = {"module": "account", "action": "balance"}
+    _NONCE_PARAMS = {"module": "proxy", "action": "eth_getTransactionCount", "tag": "latest"}
+    _TOK_PARAMS = {
+        "module": "account",
+        "action": "tokentx",
+        "page": 1,
+        "offset": 10000,
+        "sort": "desc",
+    }
+    _TX_PARAMS = {"module": "account", "action": "txlist", "page": 1, "sort": "desc"}
+
     def __init__(self, api_provider: Optional[str] = None, timeout: int = 30):
         """Initialize blockchain service.
 
@@ -34,8 +132,12 @@ class BlockchainService:
         self.provider = api_provider or Config.BLOCKCHAIN_API_PROVIDER
         self.timeout = timeout
         self.api_key = Config.get_blockchain_api_key()
-        self._rate_limit_remaining = Config.RATE_LIMIT_REQUESTS_PER_MINUTE
-        self._last_request_time = 0.0
+        # token bucket: refills continuously at the per-minute budget
+        self._capacity = float(Config.RATE_LIMIT_REQUESTS_PER_MINUTE)
+        self._tokens = self._capacity
+        self._refill_rate = self._capacity / 60.0
+        self._last_refill = time.monotonic()
+        self._rl_lock = asyncio.Lock()
 
     @staticmethod
     def validate_address(address: str) -> str:
@@ -58,7 +160,7 @@ class BlockchainService:
         address = address.strip().lower()
 
         # Check format
-        if not re.match(r"^0x[0-9a-f]{40}$", address):
+        if not _ADDRESS_RE.match(address):
             raise InvalidWalletAddressError(
                 f"Invalid wallet address format: {address}. "
                 "Must be a valid 42-character Ethereum address (0x...)"
@@ -92,16 +194,18 @@ class BlockchainService:
 
         for attempt in range(retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(method, url, params=params)
-                    response.raise_for_status()
+                client = get_http_client()
+                response = await client.request(
+                    method, url, params=params, timeout=self.timeout
+                )
+                response.raise_for_status()
 
-                    logger.info(
-                        f"API request successful: {url}",
-                        extra={"attempt": attempt + 1},
-                    )
+                logger.info(
+                    f"API request successful: {url}",
+                    extra={"attempt": attempt + 1},
+                )
 
-                    return response.json()
+                return orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -110,10 +214,10 @@ class BlockchainService:
                     raise RateLimitError("API rate limit exceeded")
 
                 if attempt < retries - 1:
-                    wait_time = Config.API_RETRY_DELAY * (2 ** attempt)
+                    wait_time = self._backoff(attempt)
                     logger.warning(
                         f"Request failed with status {e.response.status_code}, "
-                        f"retrying in {wait_time}s"
+                        f"retrying in {wait_time:.2f}s"
                     )
                     await asyncio.sleep(wait_time)
                     continue
@@ -121,8 +225,8 @@ class BlockchainService:
             except httpx.RequestError as e:
                 last_error = e
                 if attempt < retries - 1:
-                    wait_time = Config.API_RETRY_DELAY * (2 ** attempt)
-                    logger.warning(f"Request error, retrying in {wait_time}s: {str(e)}")
+                    wait_time = self._backoff(attempt)
+                    logger.warning(f"Request error, retrying in {wait_time:.2f}s: {str(e)}")
                     await asyncio.sleep(wait_time)
                     continue
 
@@ -131,26 +235,35 @@ class BlockchainService:
             f"Failed to fetch blockchain data after {retries} attempts"
         )
 
-    async def _apply_rate_limit(self) -> None:
-        """Apply rate limiting to API requests."""
-        import time
-
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        # Reset counter every minute
-        if time_since_last > 60:
-            self._rate_limit_remaining = Config.RATE_LIMIT_REQUESTS_PER_MINUTE
-            self._last_request_time = current_time
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with jitter, so concurrent retries don't line up."""
+        base = Config.API_RETRY_DELAY
+        return base * (2**attempt) + random.uniform(0, base)
 
-        if self._rate_limit_remaining <= 0:
-            wait_time = 60 - time_since_last
-            logger.warning(f"Rate limit reached, waiting {wait_time:.2f}s")
-            await asyncio.sleep(max(wait_time, 0))
-            self._rate_limit_remaining = Config.RATE_LIMIT_REQUESTS_PER_MINUTE
-            self._last_request_time = time.time()
+    async def _apply_rate_limit(self) -> None:
+        """Apply rate limiting to API requests.
 
-        self._rate_limit_remaining -= 1
+        Takes one token from the bucket, waiting just long enough for the
+        next token to refill when it is empty. The lock keeps concurrent
+        requests from spending the same token.
+        """
+        async with self._rl_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self._refill_rate
+                logger.warning(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+                # the token that refilled while sleeping is spent right away
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
 
     async def get_eth_balance(self, address: str) -> str:
         """Fetch ETH balance for wallet.
@@ -177,12 +290,7 @@ class BlockchainService:
     async def _get_balance_etherscan(self, address: str) -> str:
         """Fetch balance from Etherscan."""
         url = Config.ETHERSCAN_BASE_URL
-        params = {
-            "module": "account",
-            "action": "balance",
-            "address": address,
-            "apikey": self.api_key,
-        }
+        params = {**self._BAL_PARAMS, "address": address, "apikey": self.api_key}
 
         data = await self._make_request(url, params)
 
@@ -193,28 +301,187 @@ class BlockchainService:
 
     async def _get_balance_alchemy(self, address: str) -> str:
         """Fetch balance from Alchemy."""
+        result = await self._alchemy_rpc("eth_getBalance", [address, "latest"])
+
+        # Alchemy returns hex value, convert to decimal
+        return str(int(result or "0x0", 16))
+
+    async def _alchemy_rpc(self, method: str, params: list) -> Any:
+        """Issue a single JSON-RPC call to Alchemy.
+
+        Args:
+            method: JSON-RPC method name
+            params: Method parameters
+
+        Returns:
+            The call's ``result`` field
+
+        Raises:
+            BlockchainAPIError: If Alchemy returns an error
+
+        """
         url = f"{Config.ALCHEMY_BASE_URL}/{self.api_key}"
-        headers = {"accept": "application/json", "content-type": "application/json"}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url,
-                json={
+        client = get_http_client()
+        # serialise the body ourselves; httpx's json= goes through stdlib json
+        response = await client.post(
+            url,
+            content=orjson.dumps(
+                {
                     "jsonrpc": "2.0",
                     "id": 1,
-                    "method": "eth_getBalance",
-                    "params": [address, "latest"],
-                },
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+                    "method": method,
+                    "params": params,
+                }
+            ),
+            headers=_ALCHEMY_HEADERS,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         if "error" in data:
             raise BlockchainAPIError(f"Alchemy error: {data['error']['message']}")
 
-        # Alchemy returns hex value, convert to decimal
-        return str(int(data.get("result", "0x0"), 16))
+        return data.get("result")
+
+    async def _alchemy_batch(self, calls: list[tuple[str, list]]) -> list[Any]:
+        """Issue several JSON-RPC calls to Alchemy in one POST.
+
+        Args:
+            calls: ``(method, params)`` pairs
+
+        Returns:
+            Each call's ``result`` field, in the order of ``calls``
+
+        Raises:
+            BlockchainAPIError: If Alchemy returns an error for any call
+
+        """
+        url = f"{Config.ALCHEMY_BASE_URL}/{self.api_key}"
+
+        client = get_http_client()
+        response = await client.post(
+            url,
+            content=orjson.dumps(
+                [
+                    {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                    for i, (method, params) in enumerate(calls)
+                ]
+            ),
+            headers=_ALCHEMY_HEADERS,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        if isinstance(data, dict):
+            # the whole batch was rejected
+            message = data.get("error", {}).get("message", "Unknown error")
+            raise BlockchainAPIError(f"Alchemy error: {message}")
+
+        # responses to a batch may arrive in any order
+        by_id = {item.get("id"): item for item in data}
+        results = []
+        for i, (method, _) in enumerate(calls):
+            item = by_id.get(i)
+            if item is None:
+                raise BlockchainAPIError(f"Alchemy error: no response for {method}")
+            if "error" in item:
+                raise BlockchainAPIError(f"Alchemy error: {item['error']['message']}")
+            results.append(item.get("result"))
+
+        return results
+
+    async def get_wallet_overview(self, address: str) -> tuple[str, int]:
+        """Fetch a wallet's ETH balance and transaction count together.
+
+        On Alchemy both values come from a single batched JSON-RPC request;
+        Etherscan has no batch endpoint, so the two calls run concurrently.
+
+        Args:
+            address: Wallet address
+
+        Returns:
+            Tuple of (balance in Wei, transaction count)
+
+        Raises:
+            InvalidWalletAddressError: If address is invalid
+            BlockchainAPIError: If API call fails
+
+        """
+        address = self.validate_address(address)
+        return await self._get_overview(address, with_tx_count=True)
+
+    async def _get_overview(
+        self, address: str, with_tx_count: bool
+    ) -> tuple[str, Optional[int]]:
+        """Fetch a validated address's balance, and its nonce if asked for.
+
+        Args:
+            address: Validated wallet address
+            with_tx_count: Whether to fetch the transaction count as well
+
+        Returns:
+            Tuple of (balance in Wei, transaction count or None)
+
+        """
+        if self.provider == "alchemy":
+            if not with_tx_count:
+                return await self._get_balance_alchemy(address), None
+            balance, tx_count = await self._alchemy_batch(
+                [
+                    ("eth_getBalance", [address, "latest"]),
+                    ("eth_getTransactionCount", [address, "latest"]),
+                ]
+            )
+            return str(int(balance or "0x0", 16)), int(tx_count or "0x0", 16)
+
+        if not with_tx_count:
+            return await self._get_balance_etherscan(address), None
+        results = await asyncio.gather(
+            self._get_balance_etherscan(address),
+            self.get_transaction_count(address),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        balance, tx_count = results
+        return balance, tx_count
+
+    async def get_transaction_count(self, address: str) -> int:
+        """Fetch the number of transactions sent by a wallet (its nonce).
+
+        This is a single cheap RPC call, used as a signature to tell whether a
+        cached analysis is still current.
+
+        Args:
+            address: Wallet address
+
+        Returns:
+            Transaction count
+
+        Raises:
+            InvalidWalletAddressError: If address is invalid
+            BlockchainAPIError: If API call fails
+
+        """
+        address = self.validate_address(address)
+        logger.debug(f"Fetching transaction count for {address}")
+
+        if self.provider == "alchemy":
+            result = await self._alchemy_rpc("eth_getTransactionCount", [address, "latest"])
+        else:
+            params = {**self._NONCE_PARAMS, "address": address, "apikey": self.api_key}
+            data = await self._make_request(Config.ETHERSCAN_BASE_URL, params)
+            if "error" in data or not str(data.get("result", "")).startswith("0x"):
+                raise BlockchainAPIError(
+                    f"Etherscan error: {data.get('message') or data.get('result', 'Unknown error')}"
+                )
+            result = data["result"]
+
+        return int(result or "0x0", 16)
 
     async def get_erc20_tokens(self, address: str) -> TokenSummary:
         """Fetch ERC20 token holdings for wallet.
@@ -241,15 +508,7 @@ class BlockchainService:
     async def _get_tokens_etherscan(self, address: str) -> TokenSummary:
         """Fetch tokens from Etherscan."""
         url = Config.ETHERSCAN_BASE_URL
-        params = {
-            "module": "account",
-            "action": "tokentx",
-            "address": address,
-            "page": 1,
-            "offset": 10000,
-            "sort": "desc",
-            "apikey": self.api_key,
-        }
+        params = {**self._TOK_PARAMS, "address": address, "apikey": self.api_key}
 
         data = await self._make_request(url, params)
 
@@ -257,31 +516,45 @@ class BlockchainService:
             return TokenSummary(top_tokens=[], total_tokens_held=0, total_usd_value=None)
 
         # Parse tokens - simplified implementation
-        tokens_dict = {}
+        # keep the first (most recent) transfer per contract, and only build
+        # Token models for the handful the report shows
+        # contract -> (raw amount, contract, row); the amount is parsed once here
+        # so ranking below is a plain C-level key lookup
+        first_seen: dict[str, tuple[int, str, dict]] = {}
+        # raw contract strings already handled; most rows repeat a contract,
+        # so this skips them before any normalisation
+        seen: set[str] = set()
         for tx in data.get("result", []):
-            contract = tx.get("contractAddress", "").lower()
-            if contract and contract not in tokens_dict:
-                tokens_dict[contract] = Token(
-                    contract_address=contract,
-                    name=tx.get("tokenName", "Unknown"),
-                    symbol=tx.get("tokenSymbol", "???"),
-                    decimals=int(tx.get("tokenDecimal", 18)),
-                    balance=tx.get("value", "0"),
-                    balance_display=self._format_token_balance(
-                        tx.get("value", "0"), int(tx.get("tokenDecimal", 18))
-                    ),
-                    usd_value=None,
-                )
+            raw_contract = tx.get("contractAddress", "")
+            if raw_contract in seen:
+                continue
+            seen.add(raw_contract)
+            contract = raw_contract.lower()
+            if contract and contract not in first_seen:
+                first_seen[contract] = (_transfer_value(tx), contract, tx)
+
+        top_rows = heapq.nlargest(
+            Config.REPORT_TOP_TOKENS, first_seen.values(), key=itemgetter(0)
+        )
 
-        top_tokens = sorted(
-            tokens_dict.values(),
-            key=lambda t: int(t.balance) if t.balance.isdigit() else 0,
-            reverse=True,
-        )[:10]
+        top_tokens = [
+            Token(
+                contract_address=contract,
+                name=tx.get("tokenName", "Unknown"),
+                symbol=tx.get("tokenSymbol", "???"),
+                decimals=int(tx.get("tokenDecimal", 18)),
+                balance=tx.get("value", "0"),
+                balance_display=self._format_token_balance(
+                    tx.get("value", "0"), int(tx.get("tokenDecimal", 18))
+                ),
+                usd_value=None,
+            )
+            for _, contract, tx in top_rows
+        ]
 
         return TokenSummary(
             top_tokens=top_tokens,
-            total_tokens_held=len(tokens_dict),
+            total_tokens_held=len(first_seen),
             total_usd_value=None,
         )
 
@@ -300,7 +573,7 @@ class BlockchainService:
             limit: Number of transactions to fetch
 
         Returns:
-            TransactionSummary with transaction details
+            TransactionSummary with transaction details, newest transaction first
 
         Raises:
             InvalidWalletAddressError: If address is invalid
@@ -319,12 +592,9 @@ class BlockchainService:
         """Fetch transactions from Etherscan."""
         url = Config.ETHERSCAN_BASE_URL
         params = {
-            "module": "account",
-            "action": "txlist",
+            **self._TX_PARAMS,
             "address": address,
-            "page": 1,
             "offset": limit,
-            "sort": "desc",
             "apikey": self.api_key,
         }
 
@@ -339,49 +609,72 @@ class BlockchainService:
                 failed_transactions=0,
             )
 
+        result = data["result"]
+        total_transactions = len(result)
+
         transactions = []
         unique_addresses = set()
         contract_interactions = 0
         failed_transactions = 0
-        total_transactions = len(data.get("result", []))
 
-        for tx in data.get("result", [])[:limit]:
-            to_addr = tx.get("to", "")
-            from_addr = tx.get("from", "").lower()
+        # bind what the loop uses on every row to locals
+        append = transactions.append
+        add_address = unique_addresses.add
+        construct = Transaction.model_construct
+        format_ether = self._format_ether
+        from_ts = datetime.fromtimestamp
+        contract_type = TransactionType.CONTRACT_INTERACTION
+        receive_type = TransactionType.RECEIVE
+        send_type = TransactionType.SEND
+
+        for tx in result[:limit]:
+            get = tx.get
+            # lowercase once; every use below compares or stores the lowercase form
+            to_addr = get("to", "").lower()
+            from_addr = get("from", "").lower()
+            tx_input = get("input", "0x")
+            value = get("value", "0")
+            is_error = get("isError", "0") == "1"
 
             if to_addr:
-                unique_addresses.add(to_addr.lower())
+                add_address(to_addr)
             if from_addr:
-                unique_addresses.add(from_addr)
+                add_address(from_addr)
 
-            if tx.get("input", "0x") != "0x":
+            is_call = tx_input != "0x"
+            if is_call:
                 contract_interactions += 1
 
-            if tx.get("isError", "0") == "1":
+            if is_error:
                 failed_transactions += 1
 
             # Determine transaction type
-            tx_type = TransactionType.CONTRACT_INTERACTION
-            if to_addr.lower() == address:
-                tx_type = TransactionType.RECEIVE
-            elif tx.get("input", "0x") == "0x":
-                tx_type = TransactionType.SEND
-
-            transaction = Transaction(
-                hash=tx.get("hash", ""),
-                from_address=from_addr,
-                to_address=to_addr.lower() if to_addr else None,
-                value=tx.get("value", "0"),
-                value_display=self._format_ether(tx.get("value", "0")),
-                gas_price=tx.get("gasPrice", "0"),
-                gas_used=tx.get("gas", "0"),
-                timestamp=datetime.fromtimestamp(int(tx.get("timeStamp", 0))),
-                block_number=int(tx.get("blockNumber", 0)),
-                is_error=tx.get("isError", "0") == "1",
-                type=tx_type,
-                method_id=tx.get("input", "0x")[:10] if tx.get("input", "0x") != "0x" else None,
+            tx_type = contract_type
+            if to_addr == address:
+                tx_type = receive_type
+            elif not is_call:
+                tx_type = send_type
+
+            timestamp = from_ts(int(get("timeStamp", 0)))
+            # every field is already coerced to its final type above, so skip
+            # per-instance validation; this runs once per fetched transaction
+            append(
+                construct(
+                    hash=get("hash", ""),
+                    from_address=from_addr,
+                    to_address=to_addr or None,
+                    value=value,
+                    value_display=format_ether(value),
+                    gas_price=get("gasPrice", "0"),
+                    gas_used=get("gas", "0"),
+                    timestamp=timestamp,
+                    timestamp_display=timestamp.strftime("%Y-%m-%d"),
+                    block_number=int(get("blockNumber", 0)),
+                    is_error=is_error,
+                    type=tx_type,
+                    method_id=tx_input[:10] if is_call else None,
+                )
             )
-            transactions.append(transaction)
 
         # Remove the address itself from unique addresses
         unique_addresses.discard(address)
@@ -405,6 +698,65 @@ class BlockchainService:
             failed_transactions=0,
         )
 
+    async def get_full_wallet(
+        self, address: str, limit: int = 10, with_tx_count: bool = False
+    ) -> tuple[str, TokenSummary, TransactionSummary, Optional[int]]:
+        """Fetch balance, tokens and transactions for a wallet concurrently.
+
+        The address is validated once and the provider calls are issued
+        together, so the wall time is that of the slowest call. Token holdings
+        are optional for an analysis: if only they fail, an empty summary is
+        returned in their place. The nonce, when asked for, rides along with
+        the balance (in the same batch request on Alchemy).
+
+        Args:
+            address: Wallet address
+            limit: Number of transactions to fetch
+            with_tx_count: Whether to fetch the transaction count as well
+
+        Returns:
+            Tuple of (balance in Wei, token summary, transaction summary,
+            transaction count or None)
+
+        Raises:
+            InvalidWalletAddressError: If address is invalid
+            BlockchainAPIError: If the balance or transaction call fails
+
+        """
+        address = self.validate_address(address)
+        logger.info(f"Fetching full wallet data for {address}, limit={limit}")
+
+        if self.provider == "alchemy":
+            fetches = (
+                self._get_overview(address, with_tx_count),
+                self._get_tokens_alchemy(address),
+                self._get_transactions_alchemy(address, limit),
+            )
+        else:
+            fetches = (
+                self._get_overview(address, with_tx_count),
+                self._get_tokens_etherscan(address),
+                self._get_transactions_etherscan(address, limit),
+            )
+
+        overview, tokens, transactions = await asyncio.gather(*fetches, return_exceptions=True)
+
+        if isinstance(tokens, BlockchainServiceError):
+            logger.warning(f"Token lookup failed for {address}, continuing without: {tokens}")
+            tokens = TokenSummary(top_tokens=[], total_tokens_held=0, total_usd_value=None)
+
+        # prefer surfacing an API error over anything unexpected
+        results = (overview, tokens, transactions)
+        for result in results:
+            if isinstance(result, BlockchainServiceError):
+                raise result
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        balance, tx_count = overview
+        return balance, tokens, transactions, tx_count
+
     @staticmethod
     def _format_ether(wei: str) -> str:
         """Convert Wei to Ether string representation.
@@ -417,9 +769,7 @@ class BlockchainService:
 
         """
         try:
-            wei_int = int(wei)
-            eth = wei_int / 1e18
-            return f"{eth:.6f}".rstrip("0").rstrip(".")
+            return _format_units(int(wei), _ETH_DECIMALS)
         except (ValueError, TypeError):
             return "0"
 
@@ -436,9 +786,23 @@ class BlockchainService:
 
         """
         try:
-            balance_int = int(balance)
-            divisor = 10 ** decimals
-            formatted = balance_int / divisor
-            return f"{formatted:.6f}".rstrip("0").rstrip(".")
+            return _format_units(int(balance), decimals)
         except (ValueError, TypeError):
             return "0"
+
+
+# Global blockchain service instance
+_blockchain_service: Optional[BlockchainService] = None
+
+
+def get_blockchain_service() -> BlockchainService:
+    """Get or create global blockchain service instance.
+
+    Returns:
+        BlockchainService instance
+
+    """
+    global _blockchain_service
+    if _blockchain_service is None:
+        _blockchain_service = BlockchainService(timeout=Config.API_TIMEOUT)
+    return _blockchain_service
@@ -1,7 +1,15 @@
 """Cache service for EtherScope."""
 
+import asyncio
+import heapq
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+try:  # optional persistent tier, installed with the "disk" extra
+    import diskcache
+except ImportError:
+    diskcache = None
 
 from core.config import Config
 from core.exceptions import CacheServiceError
@@ -9,38 +17,53 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# result handed to get_or_set waiters when the caller running the load was
+# cancelled: the load is retried instead of cancelling everyone waiting on it
+_LOAD_ABANDONED = object()
+
 
 class CacheEntry:
     """Represents a cached entry with TTL."""
 
-    def __init__(self, value: Any, ttl: int):
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: Any, ttl: int, now: Optional[float] = None):
         """Initialize cache entry.
 
         Args:
             value: Cached value
             ttl: Time-to-live in seconds
+            now: Current clock reading, defaults to ``time.monotonic()``
 
         """
         self.value = value
-        self.ttl = ttl
-        self.created_at = time.time()
+        self.expires_at = (time.monotonic() if now is None else now) + ttl
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if entry has expired.
 
+        Args:
+            now: Current ``time.monotonic()`` reading, if the caller already has one
+
         Returns:
             True if entry has expired
 
         """
-        elapsed = time.time() - self.created_at
-        return elapsed > self.ttl
+        if now is None:
+            now = time.monotonic()
+        return now > self.expires_at
 
 
 class CacheService:
     """In-memory cache service for wallet analysis results."""
 
     def __init__(
-        self, enabled: bool = True, ttl: int = 300, max_size: int = 1000
+        self,
+        enabled: bool = True,
+        ttl: int = 300,
+        max_size: int = 1000,
+        disk_path: Optional[str] = None,
+        time_func: Callable[[], float] = time.monotonic,
     ):
         """Initialize cache service.
 
@@ -48,14 +71,35 @@ class CacheService:
             enabled: Whether caching is enabled
             ttl: Default time-to-live in seconds
             max_size: Maximum number of cached entries
+            disk_path: Directory for a persistent second tier behind the
+                in-memory one; None keeps the cache memory-only
+            time_func: Clock for in-memory expiry; tests pass a fake one
+
+        Raises:
+            CacheServiceError: If disk_path is given but diskcache is not installed
 
         """
         self.enabled = enabled
         self.ttl = ttl
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
+        self._time = time_func
+        # kept in least- to most-recently-used order
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, key) for every entry written; may hold stale pairs for
+        # keys that were overwritten or deleted since, see cleanup_expired
+        self._expiry_heap: list[tuple[float, str]] = []
+        # loads currently running in get_or_set, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._disk = None
+        if disk_path:
+            if diskcache is None:
+                raise CacheServiceError(
+                    "CACHE_DISK_PATH is set but diskcache is not installed"
+                )
+            self._disk = diskcache.Cache(disk_path)
         logger.info(
-            f"CacheService initialized: enabled={enabled}, ttl={ttl}s, max_size={max_size}"
+            f"CacheService initialized: enabled={enabled}, ttl={ttl}s, max_size={max_size}, "
+            f"disk={disk_path or 'off'}"
         )
 
     def get(self, key: str) -> Optional[Any]:
@@ -72,19 +116,48 @@ class CacheService:
             return None
 
         if key not in self._cache:
-            logger.debug(f"Cache miss: {key}")
-            return None
+            return self._get_from_disk(key)
 
         entry = self._cache[key]
 
-        if entry.is_expired():
+        if entry.is_expired(self._time()):
             logger.debug(f"Cache expired: {key}")
             del self._cache[key]
+            # the disk copy shares the same deadline, so it is gone too
             return None
 
+        self._cache.move_to_end(key)
         logger.debug(f"Cache hit: {key}")
         return entry.value
 
+    def _get_from_disk(self, key: str) -> Optional[Any]:
+        """Look a memory miss up in the disk tier, promoting any hit to memory.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+
+        """
+        if self._disk is None:
+            logger.debug(f"Cache miss: {key}")
+            return None
+
+        value, expire_time = self._disk.get(key, expire_time=True)
+        if value is None:
+            logger.debug(f"Cache miss: {key}")
+            return None
+
+        remaining = expire_time - time.time() if expire_time is not None else self.ttl
+        if remaining <= 0:
+            logger.debug(f"Cache expired: {key}")
+            return None
+
+        self._store(key, value, remaining)
+        logger.debug(f"Cache hit (disk): {key}")
+        return value
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache.
 
@@ -101,20 +174,92 @@ class CacheService:
             return
 
         ttl = ttl or self.ttl
+        self._store(key, value, ttl)
+        if self._disk is not None:
+            self._disk.set(key, value, expire=ttl)
 
-        # Check cache size
-        if len(self._cache) >= self.max_size:
-            # Remove oldest entry
-            oldest_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].created_at,
-            )
-            logger.debug(f"Cache full, evicting oldest entry: {oldest_key}")
-            del self._cache[oldest_key]
-
-        self._cache[key] = CacheEntry(value, ttl)
         logger.debug(f"Cache set: {key} (ttl={ttl}s)")
 
+    def _store(self, key: str, value: Any, ttl: float) -> None:
+        """Put an entry in the in-memory tier, evicting the LRU entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds
+
+        """
+        if key in self._cache:
+            # Overwrite in place; counts as the most recent use
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            # Remove least recently used entry
+            oldest_key, _ = self._cache.popitem(last=False)
+            logger.debug(f"Cache full, evicting least recently used entry: {oldest_key}")
+
+        entry = CacheEntry(value, ttl, self._time())
+        self._cache[key] = entry
+
+        if len(self._expiry_heap) > 2 * self.max_size:
+            # Drop stale pairs so overwrites can't grow the heap without bound
+            self._expiry_heap = [(e.expires_at, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+        else:
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+
+    async def get_or_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[int] = None
+    ) -> Any:
+        """Get value from cache, loading and caching it on a miss.
+
+        Concurrent misses for the same key share a single ``loader`` call:
+        the first caller runs it and the others wait for its result (or
+        its exception). If that caller is cancelled, one of the waiters
+        takes over the load rather than being cancelled along with it.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl: Time-to-live in seconds (uses default if not provided)
+
+        Returns:
+            Cached or freshly loaded value
+
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            logger.debug(f"Cache load in flight, waiting: {key}")
+            value = await asyncio.shield(inflight)
+            if value is not _LOAD_ABANDONED:
+                return value
+            logger.debug(f"Cache load abandoned, retrying: {key}")
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # only this caller was cancelled; wake the waiters so one retries
+            future.set_result(_LOAD_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # mark retrieved, there may be no other caller waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self.set(key, value, ttl)
+            return value
+        finally:
+            del self._inflight[key]
+
     def delete(self, key: str) -> None:
         """Delete value from cache.
 
@@ -125,10 +270,15 @@ class CacheService:
         if key in self._cache:
             del self._cache[key]
             logger.debug(f"Cache deleted: {key}")
+        if self._disk is not None:
+            self._disk.delete(key)
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_heap.clear()
+        if self._disk is not None:
+            self._disk.clear()
         logger.info("Cache cleared")
 
     def cleanup_expired(self) -> int:
@@ -138,17 +288,26 @@ class CacheService:
             Number of entries removed
 
         """
-        expired_keys = [
-            k for k, v in self._cache.items() if v.is_expired()
-        ]
+        now = self._time()
+        heap = self._expiry_heap
+        removed = 0
 
-        for key in expired_keys:
-            del self._cache[key]
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip pairs left behind by an overwrite or delete
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                removed += 1
+
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired cache entries")
 
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        return removed
 
-        return len(expired_keys)
+    def __len__(self) -> int:
+        """Number of in-memory entries, including expired ones not yet cleaned up."""
+        return len(self._cache)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -185,5 +344,6 @@ def get_cache_service() -> CacheService:
             enabled=Config.CACHE_ENABLED,
             ttl=Config.CACHE_TTL_SECONDS,
             max_size=Config.CACHE_MAX_SIZE,
+            disk_path=Config.CACHE_DISK_PATH,
         )
     return _cache_service
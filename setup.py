@@ -28,20 +28,25 @@ setup(
     install_requires=[
         "python-dotenv>=1.0.0",
         "python-telegram-bot>=20.0",
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
         "pydantic>=2.0.0",
         "pydantic-settings>=2.0.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0",
+            "pytest-xdist>=3.0",
             "black>=23.0",
             "flake8>=6.0",
             "mypy>=1.0",
             "isort>=5.0",
         ],
+        "disk": [
+            "diskcache>=5.6",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -8,15 +8,47 @@ from models.transaction import Transaction, TransactionSummary, TransactionType
 from models.wallet import ActivityLevel, WalletBehavior
 from services.analysis_service import AnalysisService
 
+# fixed reference time; pass it as ``now`` wherever the result depends on the clock
+_NOW = datetime(2024, 1, 1)
+_FROM = "0x1234567890123456789012345678901234567890"
+_HASH_POOL = tuple("0x" + str(i % 10) * 64 for i in range(2000))
+# field values shared by the bulk transactions below; they only feed counts
+# and timestamps, so _mk skips validation entirely
+_TX_DEFAULTS = {
+    "hash": _HASH_POOL[0],
+    "from_address": _FROM,
+    "to_address": None,
+    "value": "0",
+    "value_display": "0",
+    "gas_price": "20000000000",
+    "gas_used": "21000",
+    "timestamp": _NOW,
+    "block_number": 1000000,
+    "is_error": False,
+    "type": TransactionType.SEND,
+    "method_id": None,
+}
+
+
+def _mk(**overrides) -> Transaction:
+    """Build a Transaction from the defaults above without validating it."""
+    return Transaction.model_construct(**{**_TX_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def tx_pool():
+    """Create one shared pool of transactions; tests slice as many as they need."""
+    return [_mk(hash=_HASH_POOL[i], block_number=1000000 - i) for i in range(1000)]
+
 
 @pytest.fixture
 def sample_transactions():
     """Create sample transactions for testing."""
-    base_date = datetime.utcnow()
+    base_date = _NOW
     return [
         Transaction(
             hash="0x" + "a" * 64,
-            from_address="0x1234567890123456789012345678901234567890",
+            from_address=_FROM,
             to_address="0x0000000000000000000000000000000000000000",
             value="1000000000000000000",
             value_display="1.0",
@@ -45,13 +77,13 @@ class TestActivityDetection:
         transactions = [
             Transaction(
                 hash="0x" + "a" * 64,
-                from_address="0x1234567890123456789012345678901234567890",
+                from_address=_FROM,
                 to_address=None,
                 value="0",
                 value_display="0",
                 gas_price="20000000000",
                 gas_used="21000",
-                timestamp=datetime.utcnow(),
+                timestamp=_NOW,
                 block_number=1000000,
                 is_error=False,
                 type=TransactionType.SEND,
@@ -61,93 +93,23 @@ class TestActivityDetection:
         result = AnalysisService.detect_activity_level(transactions)
         assert result == ActivityLevel.DORMANT
 
-    def test_low_activity(self):
-        """Test low activity classification."""
-        transactions = [
-            Transaction(
-                hash="0x" + str(i) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
-                to_address=None,
-                value="0",
-                value_display="0",
-                gas_price="20000000000",
-                gas_used="21000",
-                timestamp=datetime.utcnow(),
-                block_number=1000000 - i,
-                is_error=False,
-                type=TransactionType.SEND,
-                method_id=None,
-            )
-            for i in range(8)
-        ]
-        result = AnalysisService.detect_activity_level(transactions)
-        assert result == ActivityLevel.LOW
-
-    def test_moderate_activity(self):
-        """Test moderate activity classification."""
-        transactions = [
-            Transaction(
-                hash="0x" + str(i % 10) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
-                to_address=None,
-                value="0",
-                value_display="0",
-                gas_price="20000000000",
-                gas_used="21000",
-                timestamp=datetime.utcnow(),
-                block_number=1000000 - i,
-                is_error=False,
-                type=TransactionType.SEND,
-                method_id=None,
-            )
-            for i in range(50)
-        ]
-        result = AnalysisService.detect_activity_level(transactions)
-        assert result == ActivityLevel.MODERATE
-
-    def test_active(self):
-        """Test active classification."""
-        transactions = [
-            Transaction(
-                hash="0x" + str(i % 10) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
-                to_address=None,
-                value="0",
-                value_display="0",
-                gas_price="20000000000",
-                gas_used="21000",
-                timestamp=datetime.utcnow(),
-                block_number=1000000 - i,
-                is_error=False,
-                type=TransactionType.SEND,
-                method_id=None,
-            )
-            for i in range(150)
-        ]
-        result = AnalysisService.detect_activity_level(transactions)
-        assert result == ActivityLevel.ACTIVE
-
-    def test_highly_active(self):
-        """Test highly active classification."""
-        transactions = [
-            Transaction(
-                hash="0x" + str(i % 10) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
-                to_address=None,
-                value="0",
-                value_display="0",
-                gas_price="20000000000",
-                gas_used="21000",
-                timestamp=datetime.utcnow(),
-                block_number=1000000 - i,
-                is_error=False,
-                type=TransactionType.SEND,
-                method_id=None,
-            )
-            for i in range(1500)
-        ]
-        result = AnalysisService.detect_activity_level(transactions)
-        assert result == ActivityLevel.HIGHLY_ACTIVE
+    @pytest.mark.parametrize(
+        "count,expected",
+        [
+            (4, ActivityLevel.DORMANT),
+            (5, ActivityLevel.LOW),
+            (19, ActivityLevel.LOW),
+            (20, ActivityLevel.MODERATE),
+            (99, ActivityLevel.MODERATE),
+            (100, ActivityLevel.ACTIVE),
+            (999, ActivityLevel.ACTIVE),
+            (1000, ActivityLevel.HIGHLY_ACTIVE),
+        ],
+    )
+    def test_activity_thresholds(self, tx_pool, count, expected):
+        """Test classification on either side of each transaction-count threshold."""
+        result = AnalysisService.detect_activity_level(tx_pool[:count])
+        assert result == expected
 
 
 class TestDeFiDetection:
@@ -162,14 +124,14 @@ class TestDeFiDetection:
         """Test no DeFi when no contract interactions."""
         transactions = [
             Transaction(
-                hash="0x" + str(i) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
+                hash=_HASH_POOL[i],
+                from_address=_FROM,
                 to_address="0x1111111111111111111111111111111111111111",
                 value="1000000000000000000",
                 value_display="1.0",
                 gas_price="20000000000",
                 gas_used="21000",
-                timestamp=datetime.utcnow(),
+                timestamp=_NOW,
                 block_number=1000000 - i,
                 is_error=False,
                 type=TransactionType.SEND,
@@ -184,14 +146,14 @@ class TestDeFiDetection:
         """Test DeFi detection with contract interactions."""
         transactions = [
             Transaction(
-                hash="0x" + str(i) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
+                hash=_HASH_POOL[i],
+                from_address=_FROM,
                 to_address="0x1111111111111111111111111111111111111111",
                 value="0",
                 value_display="0",
                 gas_price="20000000000",
                 gas_used="200000",
-                timestamp=datetime.utcnow(),
+                timestamp=_NOW,
                 block_number=1000000 - i,
                 is_error=False,
                 type=TransactionType.CONTRACT_INTERACTION,
@@ -203,6 +165,73 @@ class TestDeFiDetection:
         assert result is True
 
 
+class TestNFTDetection:
+    """Tests for NFT trading detection."""
+
+    @pytest.mark.parametrize(
+        "method_id,expected",
+        [
+            ("0x42842e0e", True),
+            ("0xf242432a", True),
+            # transferFrom is shared with ERC-20, so it alone is not NFT activity
+            ("0x23b872dd", False),
+            ("0xa9059cbb", False),
+            (None, False),
+        ],
+    )
+    def test_nft_transfer_selectors(self, method_id, expected):
+        """Test NFT detection keys off known NFT transfer selectors."""
+        transactions = [
+            Transaction(
+                hash="0x" + "1" * 64,
+                from_address=_FROM,
+                to_address="0x1111111111111111111111111111111111111111",
+                value="0",
+                value_display="0",
+                gas_price="20000000000",
+                gas_used="200000",
+                timestamp=_NOW,
+                block_number=1000000,
+                is_error=False,
+                type=TransactionType.CONTRACT_INTERACTION,
+                method_id=method_id,
+            )
+        ]
+        assert AnalysisService.detect_nft_trader(transactions) is expected
+
+
+class TestAggregateStream:
+    """Tests for single-pass transaction aggregation."""
+
+    def test_aggregates_from_generator(self):
+        """Test counters are gathered from a one-shot iterator."""
+        method_ids = ["0xa9059cbb", "0x42842e0e", None, "0x"]
+        transactions = (
+            Transaction(
+                hash=_HASH_POOL[i],
+                from_address=_FROM,
+                to_address=None if i == 0 else "0x1111111111111111111111111111111111111111",
+                value="0",
+                value_display="0",
+                gas_price="20000000000",
+                gas_used="21000",
+                timestamp=_NOW,
+                block_number=1000000 - i,
+                is_error=False,
+                type=TransactionType.CONTRACT_INTERACTION,
+                method_id=method_id,
+            )
+            for i, method_id in enumerate(method_ids)
+        )
+
+        stats = AnalysisService.aggregate_stream(transactions)
+
+        assert stats.total == 4
+        assert stats.contract_interactions == 2
+        assert stats.nft_interactions == 1
+        assert stats.deployments == 1
+
+
 class TestWalletScoring:
     """Tests for wallet score calculation."""
 
@@ -268,6 +297,30 @@ class TestWalletScoring:
 
         assert score <= 100
 
+    @pytest.mark.parametrize(
+        "contract_interactions,expected",
+        [(0, 5), (9, 5), (10, 10), (29, 10), (30, 20), (49, 20), (50, 30), (100, 30)],
+    )
+    def test_contract_ratio_thresholds(self, contract_interactions, expected):
+        """Test contract interaction ratio scoring at the threshold boundaries."""
+        transaction_summary = TransactionSummary(
+            total_transactions=100,
+            last_transactions=[],
+            unique_interacted_addresses=0,
+            contract_interactions=contract_interactions,
+            failed_transactions=0,
+        )
+
+        score = AnalysisService.calculate_wallet_score(
+            activity_level=ActivityLevel.DORMANT,
+            transaction_summary=transaction_summary,
+            defi_user=False,
+            nft_trader=False,
+            contract_deployer=False,
+        )
+
+        assert score == expected
+
 
 class TestDaysActive:
     """Tests for days active calculation."""
@@ -279,17 +332,16 @@ class TestDaysActive:
 
     def test_days_active_recent_transactions(self):
         """Test days active with recent transactions."""
-        now = datetime.utcnow()
         transactions = [
             Transaction(
-                hash="0x" + str(i) * 64,
-                from_address="0x1234567890123456789012345678901234567890",
+                hash=_HASH_POOL[i],
+                from_address=_FROM,
                 to_address=None,
                 value="0",
                 value_display="0",
                 gas_price="20000000000",
                 gas_used="21000",
-                timestamp=now - timedelta(days=i),
+                timestamp=_NOW - timedelta(days=i),
                 block_number=1000000 - i,
                 is_error=False,
                 type=TransactionType.SEND,
@@ -298,7 +350,17 @@ class TestDaysActive:
             for i in range(30)
         ]
 
-        days_active, first_tx_date = AnalysisService.calculate_days_active(transactions)
+        days_active, first_tx_date = AnalysisService.calculate_days_active(
+            transactions, now=_NOW
+        )
+
+        assert days_active == 29
+        assert first_tx_date == _NOW - timedelta(days=29)
+
+        # transactions are built newest first, so the sorted hint agrees
+        assert AnalysisService.calculate_days_active(
+            transactions, sorted_desc=True, now=_NOW
+        ) == (days_active, first_tx_date)
 
-        assert days_active >= 29  # At least 29 days
-        assert first_tx_date <= now
+        # without a reference time the wall clock is used, which is later still
+        assert AnalysisService.calculate_days_active(transactions)[0] >= 29
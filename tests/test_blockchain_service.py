@@ -1,8 +1,15 @@
 """Unit tests for wallet address validation and blockchain service."""
 
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import orjson
 import pytest
 
-from core.exceptions import InvalidWalletAddressError
+from core.config import Config
+from core.exceptions import BlockchainAPIError, InvalidWalletAddressError
+from services import blockchain_service as blockchain_module
 from services.blockchain_service import BlockchainService
 
 
@@ -91,6 +98,12 @@ class TestFormatting:
         result = BlockchainService._format_ether(wei)
         assert result == "1000"
 
+    def test_format_ether_beyond_float_precision(self):
+        """Test amounts above 2**53 Wei are formatted exactly."""
+        wei = "123456789012345678901234567890"
+        result = BlockchainService._format_ether(wei)
+        assert result == "123456789012.345679"
+
     def test_format_token_balance(self):
         """Test formatting token balance with decimals."""
         balance = "1000000000000000000"  # 1 token with 18 decimals
@@ -117,3 +130,239 @@ class TestFormatting:
         wei = "not_a_number"
         result = BlockchainService._format_ether(wei)
         assert result == "0"
+
+
+class TestRateLimit:
+    """Tests for the token bucket rate limiter."""
+
+    async def test_spends_tokens_without_waiting(self):
+        """Test requests within the budget don't sleep."""
+        service = BlockchainService()
+        with patch("services.blockchain_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            await service._apply_rate_limit()
+            await service._apply_rate_limit()
+        sleep.assert_not_awaited()
+        assert service._tokens == pytest.approx(service._capacity - 2, abs=0.01)
+
+    async def test_waits_for_next_token_when_empty(self):
+        """Test an empty bucket waits only for the missing fraction of a token."""
+        service = BlockchainService()
+        service._tokens = 0.5
+        with patch("services.blockchain_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            await service._apply_rate_limit()
+        (wait_time,), _ = sleep.await_args
+        assert wait_time == pytest.approx(0.5 / service._refill_rate, rel=0.01)
+        assert service._tokens == 0.0
+
+    async def test_concurrent_callers_queue_for_tokens(self):
+        """Test concurrent requests on a nearly empty bucket never share a token."""
+        service = BlockchainService()
+        clock = [1000.0]
+        service._tokens = 1.0
+        service._last_refill = clock[0]
+        waits = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay):
+            waits.append(delay)
+            clock[0] += delay
+            # let the other callers run while this one "sleeps"
+            await real_sleep(0)
+
+        with patch("services.blockchain_service.time.monotonic", new=lambda: clock[0]), patch(
+            "services.blockchain_service.asyncio.sleep", new=fake_sleep
+        ):
+            await asyncio.gather(*(service._apply_rate_limit() for _ in range(5)))
+
+        # the one token left is spent once; every other caller waits a full refill
+        token_wait = 1 / service._refill_rate
+        assert waits == [pytest.approx(token_wait)] * 4
+        assert clock[0] - 1000.0 == pytest.approx(4 * token_wait)
+        assert service._tokens == 0.0
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client."""
+
+    async def test_pool_limits_reach_the_transport(self):
+        """Test pool limits apply; httpx ignores client limits with a custom transport."""
+        with patch.object(blockchain_module, "_http_client", None):
+            client = blockchain_module.get_http_client()
+            try:
+                pool = client._transport._pool
+                assert pool._max_connections == Config.RPC_POOL_SIZE
+                assert pool._max_keepalive_connections == Config.RPC_KEEPALIVE_CONNECTIONS
+                assert pool._keepalive_expiry == Config.RPC_KEEPALIVE_EXPIRY
+            finally:
+                await client.aclose()
+
+
+class TestAlchemyBatch:
+    """Tests for batched Alchemy JSON-RPC calls."""
+
+    @staticmethod
+    def _client(reply):
+        """Build a client whose transport answers every batch with ``reply(calls)``."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=reply(orjson.loads(request.content)))
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def test_overview_in_one_request(self):
+        """Test balance and nonce come back in call order from one batch."""
+        replies = {"eth_getBalance": "0xde0b6b3a7640000", "eth_getTransactionCount": "0x2a"}
+        client = self._client(
+            lambda calls: [
+                {"jsonrpc": "2.0", "id": c["id"], "result": replies[c["method"]]}
+                for c in reversed(calls)
+            ]
+        )
+        service = BlockchainService(api_provider="alchemy")
+        with patch("services.blockchain_service.get_http_client", return_value=client):
+            overview = await service.get_wallet_overview(
+                "0x1234567890123456789012345678901234567890"
+            )
+        assert overview == ("1000000000000000000", 42)
+
+    async def test_batch_error_raises(self):
+        """Test an error on any call in the batch raises."""
+        client = self._client(
+            lambda calls: [
+                {"jsonrpc": "2.0", "id": c["id"], "error": {"message": "boom"}} for c in calls
+            ]
+        )
+        service = BlockchainService(api_provider="alchemy")
+        with patch("services.blockchain_service.get_http_client", return_value=client):
+            with pytest.raises(BlockchainAPIError):
+                await service._alchemy_batch([("eth_getBalance", ["0x0", "latest"])])
+
+
+class TestTokenParsing:
+    """Tests for Etherscan token transfer parsing."""
+
+    async def test_top_tokens_by_latest_transfer(self):
+        """Test one token per contract, ranked by its most recent transfer value."""
+        rows = [
+            {"contractAddress": f"0x{i:040x}", "tokenSymbol": f"T{i}", "value": str(i * 10)}
+            for i in range(1, 9)
+        ]
+        # an older transfer of T1 must not override the latest one
+        rows.append({"contractAddress": f"0x{1:040x}", "tokenSymbol": "T1", "value": "999"})
+        service = BlockchainService(api_provider="etherscan")
+        with patch.object(
+            service, "_make_request", new=AsyncMock(return_value={"status": "1", "result": rows})
+        ):
+            summary = await service._get_tokens_etherscan("0x" + "0" * 40)
+
+        assert summary.total_tokens_held == 8
+        assert [t.symbol for t in summary.top_tokens] == ["T8", "T7", "T6", "T5", "T4"]
+
+
+class TestFullWallet:
+    """Tests for the concurrent full wallet fetch."""
+
+    ADDRESS = "0x1234567890123456789012345678901234567890"
+
+    async def test_token_failure_degrades_to_empty_summary(self):
+        """Test a failed token lookup doesn't fail the whole fetch."""
+        service = BlockchainService(api_provider="etherscan")
+        transactions = object()
+        with patch.multiple(
+            service,
+            _get_balance_etherscan=AsyncMock(return_value="1"),
+            _get_tokens_etherscan=AsyncMock(side_effect=BlockchainAPIError("NOTOK")),
+            _get_transactions_etherscan=AsyncMock(return_value=transactions),
+        ):
+            balance, tokens, txs, tx_count = await service.get_full_wallet(self.ADDRESS)
+
+        assert balance == "1"
+        assert tokens.total_tokens_held == 0
+        assert txs is transactions
+        assert tx_count is None
+
+    async def test_alchemy_nonce_shares_the_balance_request(self):
+        """Test balance and nonce go out as one batch when the nonce is wanted."""
+        service = BlockchainService(api_provider="alchemy")
+        batch = AsyncMock(return_value=["0x1", "0x7"])
+        with patch.multiple(
+            service,
+            _alchemy_batch=batch,
+            _get_balance_alchemy=AsyncMock(side_effect=AssertionError("separate balance call")),
+            _get_tokens_alchemy=AsyncMock(return_value=None),
+            _get_transactions_alchemy=AsyncMock(return_value=None),
+        ):
+            balance, _, _, tx_count = await service.get_full_wallet(
+                self.ADDRESS, with_tx_count=True
+            )
+
+        assert (balance, tx_count) == ("1", 7)
+        batch.assert_awaited_once()
+
+    async def test_balance_failure_raises(self):
+        """Test a failed balance lookup is surfaced."""
+        service = BlockchainService(api_provider="etherscan")
+        with patch.multiple(
+            service,
+            _get_balance_etherscan=AsyncMock(side_effect=BlockchainAPIError("NOTOK")),
+            _get_tokens_etherscan=AsyncMock(return_value=None),
+            _get_transactions_etherscan=AsyncMock(return_value=None),
+        ):
+            with pytest.raises(BlockchainAPIError):
+                await service.get_full_wallet(self.ADDRESS)
+
+
+class TestTransactionParsing:
+    """Tests for Etherscan transaction list parsing."""
+
+    ADDRESS = "0x1234567890123456789012345678901234567890"
+
+    async def test_parses_types_and_counters(self):
+        """Test transaction types, counters and unique addresses."""
+        other = "0x" + "ab" * 20
+        rows = [
+            # plain send to another wallet
+            {
+                "hash": "0x1",
+                "from": self.ADDRESS,
+                "to": other.upper(),
+                "input": "0x",
+                "value": "1000000000000000000",
+                "timeStamp": "1700000000",
+                "blockNumber": "3",
+            },
+            # failed contract call
+            {
+                "hash": "0x2",
+                "from": self.ADDRESS,
+                "to": other,
+                "input": "0xa9059cbb0000",
+                "isError": "1",
+                "timeStamp": "1690000000",
+                "blockNumber": "2",
+            },
+            # incoming transfer
+            {
+                "hash": "0x3",
+                "from": other,
+                "to": self.ADDRESS,
+                "input": "0x",
+                "timeStamp": "1680000000",
+                "blockNumber": "1",
+            },
+        ]
+        service = BlockchainService(api_provider="etherscan")
+        with patch.object(
+            service, "_make_request", new=AsyncMock(return_value={"status": "1", "result": rows})
+        ):
+            summary = await service._get_transactions_etherscan(self.ADDRESS, limit=10)
+
+        send, call, receive = summary.last_transactions
+        assert [send.type, call.type, receive.type] == ["send", "contract_interaction", "receive"]
+        assert send.to_address == other
+        assert send.value_display == "1"
+        assert call.method_id == "0xa9059cbb" and call.is_error
+        assert summary.total_transactions == 3
+        assert summary.contract_interactions == 1
+        assert summary.failed_transactions == 1
+        assert summary.unique_interacted_addresses == 1
@@ -1,9 +1,12 @@
 """Unit tests for cache service."""
 
-import time
+import asyncio
+from unittest.mock import patch
 
 import pytest
 
+from core.exceptions import CacheServiceError
+from services import cache_service as cache_module
 from services.cache_service import CacheService
 
 
@@ -45,14 +48,17 @@ class TestCacheService:
 
     def test_cache_expiration(self):
         """Test cache expiration."""
-        cache_service = CacheService(enabled=True, ttl=1, max_size=10)
+        clock = [0.0]
+        cache_service = CacheService(
+            enabled=True, ttl=1, max_size=10, time_func=lambda: clock[0]
+        )
         cache_service.set("key1", "value1")
 
         # Immediately check - should exist
         assert cache_service.get("key1") == "value1"
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Move past expiration
+        clock[0] += 1.1
 
         # Should be expired
         assert cache_service.get("key1") is None
@@ -79,12 +85,32 @@ class TestCacheService:
         cache_service.set("key3", "value3")
 
         # Cache should be at max size
-        assert cache_service.get_stats()["size"] == 3
+        assert len(cache_service) == 3
 
         # Add one more - should evict oldest
         cache_service.set("key4", "value4")
 
         # Should still be at max size
+        assert len(cache_service) == 3
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test eviction drops the least recently used entry."""
+        cache_service = CacheService(enabled=True, ttl=10, max_size=3)
+
+        cache_service.set("key1", "value1")
+        cache_service.set("key2", "value2")
+        cache_service.set("key3", "value3")
+
+        # Touch key1 so key2 becomes the least recently used
+        assert cache_service.get("key1") == "value1"
+        cache_service.set("key4", "value4")
+
+        assert cache_service.get("key2") is None
+        assert cache_service.get("key1") == "value1"
+        assert cache_service.get("key4") == "value4"
+
+        # Overwriting an existing key must not evict anything
+        cache_service.set("key1", "updated")
         assert cache_service.get_stats()["size"] == 3
 
     def test_cache_stats(self, cache_service):
@@ -101,14 +127,17 @@ class TestCacheService:
 
     def test_cache_cleanup_expired(self):
         """Test cleanup of expired entries."""
-        cache_service = CacheService(enabled=True, ttl=1, max_size=10)
+        clock = [0.0]
+        cache_service = CacheService(
+            enabled=True, ttl=1, max_size=10, time_func=lambda: clock[0]
+        )
 
         # Add entries
         cache_service.set("key1", "value1", ttl=1)
         cache_service.set("key2", "value2", ttl=10)
 
-        # Wait for first to expire
-        time.sleep(1.1)
+        # Move past the first one's expiry
+        clock[0] += 1.1
 
         # Cleanup should remove expired entry
         removed = cache_service.cleanup_expired()
@@ -118,6 +147,20 @@ class TestCacheService:
         assert cache_service.get("key1") is None
         assert cache_service.get("key2") == "value2"
 
+    def test_cache_cleanup_skips_overwritten_entries(self):
+        """Test cleanup ignores the expiry of a value that was since overwritten."""
+        clock = [100.0]
+        cache_service = CacheService(
+            enabled=True, ttl=1, max_size=10, time_func=lambda: clock[0]
+        )
+
+        cache_service.set("key1", "old", ttl=1)
+        cache_service.set("key1", "new", ttl=10)
+
+        clock[0] = 105.0
+        assert cache_service.cleanup_expired() == 0
+        assert cache_service.get("key1") == "new"
+
     def test_cache_complex_values(self, cache_service):
         """Test caching complex data structures."""
         complex_data = {
@@ -131,3 +174,78 @@ class TestCacheService:
 
         assert result == complex_data
         assert result["nested"]["key"] == "value"
+
+    async def test_get_or_set_shares_concurrent_loads(self, cache_service):
+        """Test concurrent misses for one key run the loader once."""
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "value"
+
+        results = await asyncio.gather(
+            *(cache_service.get_or_set("key1", loader) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert cache_service.get("key1") == "value"
+
+    async def test_get_or_set_propagates_loader_error(self, cache_service):
+        """Test a failed load reaches every waiter and caches nothing."""
+
+        async def loader():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            cache_service.get_or_set("key1", loader),
+            cache_service.get_or_set("key1", loader),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert cache_service.get("key1") is None
+
+    async def test_get_or_set_survives_cancelled_loader(self, cache_service):
+        """Test a waiter takes over the load when the caller running it is cancelled."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(cache_service.get_or_set("key1", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache_service.get_or_set("key1", loader))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        assert await waiter == "value"
+        assert calls == 2
+        assert cache_service.get("key1") == "value"
+
+    def test_disk_path_without_diskcache(self, tmp_path):
+        """Test the disk tier is refused when diskcache is not installed."""
+        with patch.object(cache_module, "diskcache", None):
+            with pytest.raises(CacheServiceError):
+                CacheService(disk_path=str(tmp_path))
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Test entries written through to disk are served by a fresh instance."""
+        pytest.importorskip("diskcache")
+        CacheService(disk_path=str(tmp_path)).set("key", {"a": 1}, ttl=60)
+
+        cache = CacheService(disk_path=str(tmp_path))
+        assert cache.get("key") == {"a": 1}
+        # promoted into memory on the way out
+        assert "key" in cache._cache
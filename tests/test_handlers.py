@@ -1,11 +1,45 @@
 """Unit tests for Telegram bot handlers."""
 
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
 import pytest
-from types import SimpleNamespace
 
 from bot import handlers
 
 
+@pytest.fixture(scope="module")
+def event_loop():
+    """Share one event loop across this module's tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def accept_any_address(monkeypatch):
+    """Bypass address validation so a handler always reaches the blockchain layer."""
+    monkeypatch.setattr(
+        handlers.BlockchainService, "validate_address", staticmethod(lambda a: a)
+    )
+
+
+@dataclass(slots=True)
+class _User:
+    id: int
+
+
+@dataclass(slots=True)
+class _Chat:
+    id: int
+
+
+@dataclass(slots=True)
+class _Bot:
+    send_chat_action: Callable[..., Awaitable[None]]
+
+
 class DummyMessage:
     def __init__(self):
         self.replies = []
@@ -21,7 +55,7 @@ class DummyCallbackQuery:
     def __init__(self, data):
         self.data = data
         self.message = DummyMessage()
-        self.from_user = SimpleNamespace(id=1)
+        self.from_user = _User(1)
         self.answered = False
 
     async def answer(self):
@@ -35,7 +69,7 @@ class DummyUpdate:
         self.effective_user = (
             callback_query.from_user if callback_query else (message.from_user if message else None)
         )
-        self.effective_chat = SimpleNamespace(id=123)
+        self.effective_chat = _Chat(123)
 
 
 class DummyContext:
@@ -46,10 +80,9 @@ class DummyContext:
             # mimic bot typing indicator; do nothing
             return None
 
-        self.bot = SimpleNamespace(send_chat_action=send_chat_action)
+        self.bot = _Bot(send_chat_action)
 
 
-@pytest.mark.asyncio
 async def test_health_button_callback(monkeypatch):
     update = DummyUpdate(callback_query=DummyCallbackQuery("health"))
     context = DummyContext()
@@ -63,7 +96,6 @@ async def test_health_button_callback(monkeypatch):
     assert "EtherScope Bot Status" in update.callback_query.message.replies[0]
 
 
-@pytest.mark.asyncio
 async def test_callback_query_too_old(monkeypatch):
     """Simulate BadRequest when answering a callback query."""
     class ExpiredQuery(DummyCallbackQuery):
@@ -80,7 +112,6 @@ async def test_callback_query_too_old(monkeypatch):
     assert "EtherScope Bot Status" in update.callback_query.message.replies[0]
 
 
-@pytest.mark.asyncio
 async def test_analyze_button_sets_state(monkeypatch):
     update = DummyUpdate(callback_query=DummyCallbackQuery("analyze"))
     context = DummyContext()
@@ -92,7 +123,6 @@ async def test_analyze_button_sets_state(monkeypatch):
     assert "wallet address" in update.callback_query.message.replies[0]
 
 
-@pytest.mark.asyncio
 async def test_text_router_triggers_analysis(monkeypatch):
     called = []
 
@@ -102,26 +132,27 @@ async def test_text_router_triggers_analysis(monkeypatch):
     monkeypatch.setattr(handlers, "perform_analysis", fake_analysis)
 
     # set up state for user 1
-    handlers.user_states[1] = "awaiting_wallet"
+    handlers.user_states.set(1, "awaiting_wallet")
 
     msg = DummyMessage()
     msg.text = "0xABCDEF"
-    msg.from_user = SimpleNamespace(id=1)
+    msg.from_user = _User(1)
     update = DummyUpdate(message=msg)
     context = DummyContext()
 
     await handlers.text_router(update, context)
+    # analysis runs on the chat's worker task
+    await asyncio.gather(*list(handlers._chat_workers.values()))
 
     assert called == ["0xABCDEF"]
     # state should have been cleared
-    assert 1 not in handlers.user_states
+    assert handlers.user_states.get(1) is None
 
 
-@pytest.mark.asyncio
 async def test_text_router_ignores_without_state(monkeypatch):
     msg = DummyMessage()
     msg.text = "just some text"
-    msg.from_user = SimpleNamespace(id=2)
+    msg.from_user = _User(2)
     update = DummyUpdate(message=msg)
     context = DummyContext()
 
@@ -129,23 +160,185 @@ async def test_text_router_ignores_without_state(monkeypatch):
     assert "Please use the buttons" in msg.replies[0]
 
 
-@pytest.mark.asyncio
-async def test_perform_analysis_handles_blockchain_error(monkeypatch):
-    # bypass address validation so blockchain call is attempted
-    monkeypatch.setattr(handlers.BlockchainService, "validate_address", lambda a: a)
+async def test_perform_analysis_rejects_invalid_address(monkeypatch):
+    async def fail_fetch(*args, **kwargs):
+        raise AssertionError("invalid address should not be fetched")
+
+    monkeypatch.setattr(handlers.get_blockchain_service(), "get_full_wallet", fail_fetch)
+
+    msg = DummyMessage()
+    msg.from_user = _User(7)
+    update = DummyUpdate(message=msg)
+
+    await handlers.perform_analysis(update, DummyContext(), "0xnot-an-address")
+
+    assert any("Invalid Wallet Address" in r for r in msg.replies)
 
-    # make blockchain_service raise error during balance fetch
-    async def fake_get_eth_balance(addr):
+
+async def test_perform_analysis_handles_blockchain_error(monkeypatch, accept_any_address):
+    # make blockchain_service raise error during the wallet fetch
+    async def fake_get_full_wallet(addr, **kwargs):
         raise handlers.BlockchainServiceError("Etherscan error: NOTOK")
 
-    monkeypatch.setattr(handlers.blockchain_service, "get_eth_balance", fake_get_eth_balance)
+    async def fake_get_transaction_count(addr):
+        return None
+
+    service = handlers.get_blockchain_service()
+    monkeypatch.setattr(service, "get_full_wallet", fake_get_full_wallet)
+    monkeypatch.setattr(service, "get_transaction_count", fake_get_transaction_count)
 
     msg = DummyMessage()
     msg.text = "0x0000000000000000000000000000000000000000"
-    msg.from_user = SimpleNamespace(id=3)
+    msg.from_user = _User(3)
     update = DummyUpdate(message=msg)
     context = DummyContext()
 
     await handlers.perform_analysis(update, context, "0x0000000000000000000000000000000000000000")
     # should reply with error message containing "Blockchain API Error"
     assert any("Blockchain API Error" in r for r in msg.replies)
+
+
+async def test_schedule_preserves_order_within_chat():
+    order = []
+
+    def job(n):
+        async def run():
+            await asyncio.sleep(0)
+            order.append(n)
+
+        return run
+
+    for n in range(3):
+        handlers.schedule(123, job(n))
+    await asyncio.gather(*list(handlers._chat_workers.values()))
+
+    assert order == [0, 1, 2]
+    assert 123 not in handlers._chat_queues
+
+
+async def test_schedule_recovers_after_cancelled_job():
+    ran = []
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    async def follow_up():
+        ran.append(True)
+
+    handlers.schedule(456, cancelled)
+    with pytest.raises(asyncio.CancelledError):
+        await handlers._chat_workers[456]
+    assert 456 not in handlers._chat_queues
+    assert 456 not in handlers._chat_workers
+
+    handlers.schedule(456, follow_up)
+    await asyncio.gather(*list(handlers._chat_workers.values()))
+
+    assert ran == [True]
+
+
+def test_split_message_keeps_chunks_within_limit():
+    message = "\n".join(f"line {i}" for i in range(100))
+    chunks = handlers._split_message(message, max_length=50)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert "".join(chunks) == message
+
+
+async def test_perform_analysis_revalidates_cached_signature(monkeypatch):
+    address = "0x0000000000000000000000000000000000000001"
+    monkeypatch.setattr(handlers.Config, "CACHE_SIGNATURE_STRATEGY", "tx_count")
+    monkeypatch.setattr(handlers, "format_wallet_analysis", lambda a: ["cached report"])
+    handlers.get_cache_service().set(f"analysis:{address}", (7, object()))
+
+    async def fake_get_transaction_count(addr):
+        return 7
+
+    async def fail_fetch(*args, **kwargs):
+        raise AssertionError("cache hit should not refetch")
+
+    service = handlers.get_blockchain_service()
+    monkeypatch.setattr(service, "get_transaction_count", fake_get_transaction_count)
+    monkeypatch.setattr(service, "get_full_wallet", fail_fetch)
+
+    msg = DummyMessage()
+    msg.from_user = _User(4)
+    update = DummyUpdate(message=msg)
+
+    await handlers.perform_analysis(update, DummyContext(), address)
+
+    assert msg.replies == ["cached report"]
+    handlers.get_cache_service().delete(f"analysis:{address}")
+
+
+async def test_perform_analysis_serves_cache_when_revalidation_fails(monkeypatch):
+    address = "0x0000000000000000000000000000000000000002"
+    monkeypatch.setattr(handlers.Config, "CACHE_SIGNATURE_STRATEGY", "tx_count")
+    monkeypatch.setattr(handlers, "format_wallet_analysis", lambda a: ["cached report"])
+    handlers.get_cache_service().set(f"analysis:{address}", (7, object()))
+
+    async def failing_get_transaction_count(addr):
+        raise handlers.BlockchainServiceError("Rate limit exceeded")
+
+    async def fail_fetch(*args, **kwargs):
+        raise AssertionError("cache hit should not refetch")
+
+    service = handlers.get_blockchain_service()
+    monkeypatch.setattr(service, "get_transaction_count", failing_get_transaction_count)
+    monkeypatch.setattr(service, "get_full_wallet", fail_fetch)
+
+    msg = DummyMessage()
+    msg.from_user = _User(5)
+    update = DummyUpdate(message=msg)
+
+    await handlers.perform_analysis(update, DummyContext(), address)
+
+    assert msg.replies == ["cached report"]
+    handlers.get_cache_service().delete(f"analysis:{address}")
+
+
+async def test_perform_analysis_refreshes_stale_signature(monkeypatch):
+    address = "0x0000000000000000000000000000000000000003"
+    fresh = object()
+    monkeypatch.setattr(handlers.Config, "CACHE_SIGNATURE_STRATEGY", "tx_count")
+    monkeypatch.setattr(
+        handlers,
+        "format_wallet_analysis",
+        lambda a: ["fresh report" if a is fresh else "stale report"],
+    )
+    handlers.get_cache_service().set(f"analysis:{address}", (7, object()))
+    loads = []
+
+    async def fake_get_transaction_count(addr):
+        return 8
+
+    async def fake_load_analysis(service, addr, signature):
+        loads.append(signature)
+        return signature, fresh
+
+    service = handlers.get_blockchain_service()
+    monkeypatch.setattr(service, "get_transaction_count", fake_get_transaction_count)
+    monkeypatch.setattr(handlers, "_load_analysis", fake_load_analysis)
+
+    msg = DummyMessage()
+    msg.from_user = _User(6)
+    update = DummyUpdate(message=msg)
+
+    await handlers.perform_analysis(update, DummyContext(), address)
+
+    # the nonce fetched for revalidation is reused, not fetched again
+    assert loads == [8]
+    assert msg.replies == ["fresh report"]
+    assert handlers.get_cache_service().get(f"analysis:{address}") == (8, fresh)
+    handlers.get_cache_service().delete(f"analysis:{address}")
+
+
+def test_pack_sections_splits_between_sections():
+    sections = ["<b>one</b>", "<code>two</code>", "<b>three</b>"]
+
+    assert handlers._pack_sections(sections) == ["\n\n".join(sections)]
+    assert handlers._pack_sections(sections, max_length=30) == [
+        "<b>one</b>\n\n<code>two</code>",
+        "<b>three</b>",
+    ]